@@ -0,0 +1,128 @@
+"""
+Batched Gillespie direct-method SSA in NumPy.
+
+All cells of a gradient share the generated network and are advanced
+together: the state is an ``(n_cells, n_species)`` count array, every step
+draws one event for each unfinished cell, and cells only differ in their
+ligand concentration ``A1`` (and so in their rate vectors).
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from network import Network, Observables, build_network
+
+
+def with_ones(state: np.ndarray) -> np.ndarray:
+    """Append a column of ones so padded (-1) reactant indices read as 1."""
+    return np.concatenate([state, np.ones(state.shape[:-1] + (1,), state.dtype)], -1)
+
+
+def propensities(network: Network, rates: np.ndarray, state: np.ndarray):
+    """Mass-action propensities for a ``with_ones`` state, shape ``(..., R)``."""
+    first, second = network.reactants.T
+    return rates * state[..., first] * state[..., second]
+
+
+def choose_reaction(a: np.ndarray, total: np.ndarray, rng: np.random.Generator):
+    """Index of the reaction that fires in each row, drawn with weights ``a``."""
+    u = rng.random(len(a)) * total
+    reaction = (np.cumsum(a, axis=1) < u[:, None]).sum(axis=1)
+    return np.minimum(reaction, a.shape[1] - 1)
+
+
+def output_array(
+    n_cells: int,
+    timespan: np.ndarray,
+    network: Network,
+    observables: Observables | None,
+) -> np.ndarray:
+    """Sample buffer for all species, or for ``observables`` when given."""
+    if observables is None:
+        return np.empty((n_cells, len(timespan), network.n_species), dtype=np.int32)
+    integral = observables.weights.dtype.kind == "i"
+    return np.empty(
+        (n_cells, len(timespan), len(observables)),
+        dtype=np.int32 if integral else float,
+    )
+
+
+def record_samples(
+    out, state, sample, timespan, cells, next_time, observables=None, final=None
+):
+    """Store the current state at every sample time before ``next_time``.
+
+    With ``observables`` only their values are stored; ``final`` then receives
+    the full counts at the last sample time.
+    """
+    while True:
+        k = sample[cells]
+        due = k < len(timespan)
+        due[due] = timespan[k[due]] < next_time[due]
+        if not due.any():
+            return
+        counts = state[cells[due], :-1]
+        out[cells[due], k[due]] = counts if observables is None else observables(counts)
+        if final is not None:
+            last = k[due] == len(timespan) - 1
+            final[cells[due][last]] = counts[last]
+        sample[cells[due]] += 1
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+    profile=None,
+) -> np.ndarray:
+    """Exact SSA trajectories of many cells, sampled at ``timespan``.
+
+    ``A1`` holds one ligand concentration per cell and ``init`` the counts
+    at time 0, either one state for all cells or one row per cell. Returns an
+    int32 array of shape ``(n_cells, len(timespan), n_species)``, or only the
+    ``observables`` in place of the species. ``final``, if given, is filled
+    with the full counts of every cell at the last sample time, and a
+    ``profiling.ReactionProfile`` passed as ``profile`` counts every event.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    n_cells, n_species = len(A1), network.n_species
+    rates = network.rates(A1)
+    state = with_ones(np.broadcast_to(init, (n_cells, n_species)).astype(np.int64))
+    stoichiometry = np.pad(network.stoichiometry, ((0, 0), (0, 1)))
+    rng = np.random.default_rng(seed)
+
+    out = output_array(n_cells, timespan, network, observables)
+    time = np.zeros(n_cells)
+    sample = np.zeros(n_cells, dtype=np.int64)
+    cells = np.arange(n_cells)
+    tick = perf_counter()
+    while len(cells):
+        a = propensities(network, rates[cells], state[cells])
+        total = a.sum(axis=1)
+        with np.errstate(divide="ignore"):
+            step = rng.exponential(1.0, len(cells)) / total
+        next_time = time[cells] + step
+
+        # the pre-event state holds at every sample time the event jumps over
+        record_samples(
+            out, state, sample, timespan, cells, next_time, observables, final
+        )
+
+        firing = np.isfinite(next_time)
+        reaction = choose_reaction(a, total, rng)
+        state[cells[firing]] += stoichiometry[reaction[firing]]
+        if profile is not None:
+            # only count what happens up to the last sample
+            end = np.minimum(next_time, timespan[-1])
+            counted = np.where(next_time <= timespan[-1], reaction, -1)
+            profile.record(counted, a, end - time[cells], perf_counter() - tick)
+            tick = perf_counter()
+        time[cells] = next_time
+        cells = cells[sample[cells] < len(timespan)]
+    return out
@@ -0,0 +1,244 @@
+"""
+Time every stage of a simulation on representative workloads.
+
+The stages are those of ``main.py``: building the gillespy2 model and
+compiling (or loading) the solver, both once per process, running it,
+converting the results with ``to_array`` and writing the chunk to the
+trajectory store. The NumPy engines have no model or compile stage and
+produce arrays directly. Each workload reports seconds per stage, simulated events per second and bytes
+written; ``mi`` times the mutual information analysis of a gradient
+instead.
+
+Event counts are the integral of the total propensity over the sampled
+states, i.e. the expected number of SSA events, so every engine (including
+the compiled solver, which does not report them) is measured the same way.
+
+Results can be saved as a baseline and later runs compared against it;
+``benchmark_baseline.json`` holds one for ``ssa``, ``batch`` and ``jit``
+(all but ``long`` for the first two), and a workload missing from it is
+reported as having no baseline:
+
+    python benchmark.py --save-baseline
+    python benchmark.py --workloads single gradient --compare
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+import solver_cache
+from batch_ssa import propensities, with_ones
+from model import ParameterValues, SomeModel
+from mutual_information import direct_estimate
+from network import RECEPTOR_LEVELS, build_network
+from simulation import ENGINES, SEED_LIMIT, SOLVERS
+from sweep import exponential_gradient
+from trajectory_store import append
+
+BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+STAGES = ("build", "compile", "run", "to_array", "write", "analysis")
+
+
+@dataclass(frozen=True)
+class Workload:
+    cells: int = 1
+    chunks: int = 1
+    chunk_time: float = 100.0
+    points: int = 100
+    replicates: int = 1
+
+    @property
+    def timespan(self) -> np.ndarray:
+        return np.linspace(self.chunk_time / self.points, self.chunk_time, self.points)
+
+
+WORKLOADS = {
+    "single": Workload(),
+    "gradient": Workload(cells=36),
+    # 240 hours as hour-long chunks sampled every minute
+    "long": Workload(chunks=240, chunk_time=3600.0, points=60),
+    "mi": Workload(cells=36, replicates=20),
+}
+
+
+@dataclass
+class Report:
+    seconds: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    events: float = 0.0
+    bytes_written: int = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        yield
+        self.seconds[name] += time.perf_counter() - start
+
+    def summary(self) -> dict[str, float]:
+        total = sum(self.seconds.values())
+        simulated = self.seconds["run"]
+        return {
+            **{stage: self.seconds[stage] for stage in STAGES},
+            "total": total,
+            "events": self.events,
+            "events_per_s": self.events / simulated if simulated else 0.0,
+            "bytes_written": self.bytes_written,
+        }
+
+
+def expected_events(time: np.ndarray, counts: np.ndarray, A1) -> float:
+    """Integral of the total propensity over samples ``counts`` (``(..., T, S)``)."""
+    network = build_network()
+    rates = network.rates(np.atleast_1d(A1))[..., None, :]
+    total = propensities(network, rates, with_ones(counts)).sum(axis=-1)
+    # each sampled state is taken to hold until the next sample
+    return float((total[..., :-1] * np.diff(time)).sum())
+
+
+def _ssa_chunk(pv: ParameterValues, seed: int, report: Report):
+    """``simulation.run_chunk`` for ``"ssa"``, timing each stage.
+
+    Like ``solver_cache.compiled_solver``, only the first chunk in the
+    process builds the model and compiles or loads the solver.
+    """
+    key = solver_cache.topology_key(build_network())
+    if key not in solver_cache._solvers:
+        with report.stage("build"):
+            model = SomeModel(pv)
+        with report.stage("compile"):
+            solver_cache._solvers[key] = solver_cache.CachedSSACSolver(model, key)
+    solver = solver_cache.compiled_solver(pv)
+    with report.stage("run"):
+        solver.model.timespan(pv.timespan)
+        variables = solver_cache.runtime_variables(pv)
+        results = solver.run(variables=variables, seed=seed)
+    with report.stage("to_array"):
+        array = results.to_array()[0][-len(pv.timespan) :]
+    counts = np.empty((len(array), array.shape[1] - 1), dtype=np.int64)
+    counts[:, np.argsort(build_network().species)] = np.rint(array[:, 1:])
+    return array[:, 0], counts
+
+
+def simulate(
+    workload: Workload, solver: str, A1: float, seed: int, report: Report, root: Path
+) -> np.ndarray:
+    """Run ``workload`` chunk by chunk, writing each chunk to the store at ``root``.
+
+    Returns the final counts of every cell and replicate.
+    """
+    network = build_network()
+    levels = np.repeat(exponential_gradient(workload.cells, 8.0), workload.replicates)
+    cell_A1 = A1 * levels
+    state = np.tile(network.free_state(RECEPTOR_LEVELS), (len(cell_A1), 1))
+    rng = np.random.default_rng(seed)
+    for chunk in range(workload.chunks):
+        start = chunk * workload.chunk_time
+        if solver == "ssa":
+            recorded = []
+            for cell, value in enumerate(cell_A1):
+                pv = ParameterValues(workload.timespan, value, state[cell], solver)
+                time, counts = _ssa_chunk(pv, int(rng.integers(1, SEED_LIMIT)), report)
+                state[cell] = counts[-1]
+                recorded.append(counts)
+            recorded = np.stack(recorded)
+        else:
+            time = workload.timespan
+            final = np.empty_like(state, dtype=float if solver == "ode" else np.int64)
+            with report.stage("run"):
+                recorded = ENGINES[solver](cell_A1, state, time, seed=rng, final=final)
+            state = final
+        report.events += expected_events(time, recorded, cell_A1)
+        with report.stage("write"):
+            for cell, counts in enumerate(recorded):
+                append(root, "bench", cell, chunk, start + time, counts)
+    report.bytes_written = sum(p.stat().st_size for p in root.rglob("*.parquet"))
+    return state
+
+
+def run_workload(name: str, solver: str, A1: float, seed: int, cold: bool) -> Report:
+    """Time one workload in a scratch store; ``cold`` also times a fresh compile."""
+    workload, report = WORKLOADS[name], Report()
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch = Path(scratch)
+        cache_dir = solver_cache.CACHE_DIR
+        solver_cache._solvers.clear()
+        if cold:
+            solver_cache.CACHE_DIR = scratch / "cache"
+        try:
+            state = simulate(workload, solver, A1, seed, report, scratch / "store")
+        finally:
+            solver_cache.CACHE_DIR = cache_dir
+            solver_cache._solvers.clear()
+        if name == "mi":
+            tetramers = build_network().tetramer_observables()(state)
+            y = tetramers.T.reshape(len(tetramers.T), workload.cells, -1)
+            with report.stage("analysis"):
+                direct_estimate(y, seed=seed)
+    return report
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Lines describing each workload's time relative to the baseline."""
+    lines = []
+    for name, result in results.items():
+        if name not in baseline:
+            lines.append(f"{name}: no baseline")
+            continue
+        ratio = result["total"] / baseline[name]["total"]
+        verdict = "REGRESSION" if ratio > tolerance else "ok"
+        lines.append(f"{name}: {ratio:.2f}x baseline total time  {verdict}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS)
+    )
+    parser.add_argument("--solver", choices=SOLVERS, default="ssa")
+    parser.add_argument("--A1", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cold", action="store_true", help="compile from scratch")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.workloads:
+        results[name] = summary = run_workload(
+            name, args.solver, args.A1, args.seed, args.cold
+        ).summary()
+        stages = "  ".join(f"{s} {summary[s]:.3f}s" for s in STAGES if summary[s])
+        print(
+            f"{name}: {stages}  total {summary['total']:.3f}s  "
+            f"{summary['events_per_s']:.3g} events/s  "
+            f"{summary['bytes_written']} bytes"
+        )
+    results = {f"{args.solver}/{name}": value for name, value in results.items()}
+
+    if args.save_baseline:
+        stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        stored.update(results)
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+    regressions = False
+    if args.compare:
+        baseline = (
+            json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        )
+        for line in compare(results, baseline, args.tolerance):
+            print(line)
+            regressions |= line.endswith("REGRESSION")
+    return int(regressions)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Binary checkpoints for chunked single-cell runs.
+
+A checkpoint holds everything needed to continue a cell: its last counts in
+network species order, the simulated time so far and the state of its random
+number generator. Resuming reads one small ``.npz`` file instead of the whole
+trajectory, so the cost of a chunk no longer grows with the simulated time.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from network import build_network
+
+
+@dataclass
+class Checkpoint:
+    state: np.ndarray
+    time: float
+    rng: np.random.Generator
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint, replacing ``path`` atomically."""
+        path = Path(path)
+        partial = path.with_suffix(f".{os.getpid()}.npz")
+        np.savez(
+            partial,
+            species=np.array(build_network().species),
+            state=self.state,
+            time=self.time,
+            rng=json.dumps(self.rng.bit_generator.state),
+        )
+        os.replace(partial, path)
+
+
+def load(path: str | Path) -> Checkpoint:
+    """Read a checkpoint written by ``Checkpoint.save``."""
+    with np.load(path) as data:
+        if tuple(data["species"]) != build_network().species:
+            raise ValueError(f"{path} was written for a different network")
+        rng_state = json.loads(str(data["rng"]))
+        rng = np.random.Generator(getattr(np.random, rng_state["bit_generator"])())
+        rng.bit_generator.state = rng_state
+        return Checkpoint(data["state"], float(data["time"]), rng)
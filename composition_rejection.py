@@ -0,0 +1,130 @@
+"""
+Composition-rejection SSA (Slepoy, Thompson & Plimpton 2008), one cell at a time.
+
+Propensities here span many decades, from the ``Boost_up`` assembly steps
+to endocytosis at 0.0005 per complex. Reactions are kept in groups by the
+power of two just above their propensity, ``a`` in ``[2**(g-1), 2**g)``.
+An event picks a group with probability proportional to its summed
+propensity (a short linear scan, there are only a few dozen groups) and
+then a member by rejection: draw one uniformly and accept it with
+probability ``a / 2**g``, which succeeds at least half of the time. After an
+event the reactions in its dependency graph entry move between groups in
+constant time, so the cost per event does not grow with the number of
+reactions.
+"""
+
+import math
+
+import numpy as np
+
+from network import Network, Observables
+from next_reaction import run_cells
+
+
+class Groups:
+    """Reactions binned by ``frexp`` exponent of their propensity."""
+
+    def __init__(self, a: list[float]):
+        self.a = [0.0] * len(a)
+        self.group = [None] * len(a)
+        self.position = [0] * len(a)
+        self.members: dict[int, list[int]] = {}
+        self.sums: dict[int, float] = {}
+        for k, value in enumerate(a):
+            self.set(k, value)
+
+    def set(self, k: int, value: float) -> None:
+        old = self.group[k]
+        new = math.frexp(value)[1] if value > 0 else None
+        if old is not None:
+            self.sums[old] -= self.a[k]
+        if new != old:
+            if old is not None:
+                self._remove(k, old)
+            if new is not None:
+                members = self.members.setdefault(new, [])
+                self.sums.setdefault(new, 0.0)
+                self.position[k] = len(members)
+                members.append(k)
+            self.group[k] = new
+        if new is not None:
+            self.sums[new] += value
+        self.a[k] = value
+
+    def _remove(self, k: int, group: int) -> None:
+        members = self.members[group]
+        last = members.pop()
+        if last != k:
+            members[self.position[k]] = last
+            self.position[last] = self.position[k]
+        if not members:
+            del self.members[group], self.sums[group]
+
+    def refresh(self) -> None:
+        """Recompute the group sums, dropping accumulated rounding error."""
+        a = self.a
+        for group, members in self.members.items():
+            self.sums[group] = math.fsum(a[k] for k in members)
+
+    def total(self) -> float:
+        return sum(self.sums.values())
+
+    def choose(self, total: float, random) -> int:
+        threshold = random() * total
+        for group, value in self.sums.items():
+            threshold -= value
+            if threshold < 0:
+                break
+        members, ceiling, a = self.members[group], math.ldexp(1.0, group), self.a
+        while True:
+            k = members[int(random() * len(members))]
+            if random() * ceiling < a[k]:
+                return k
+
+
+def _simulate_cell(network, graph, changes, rates, state, timespan, rng, record):
+    """Run one cell from ``state``; ``record(k, counts)`` stores sample ``k``.
+
+    Returns the counts at the last sample time.
+    """
+    first, second = network.reactants.T.tolist()
+    x = state.tolist() + [1]  # the padded reactant index -1 reads this 1
+    rates = rates.tolist()
+    groups = Groups([r * x[i] * x[j] for r, i, j in zip(rates, first, second)])
+    random, exponential = rng.random, rng.exponential
+
+    t, sample, n_samples = 0.0, 0, len(timespan)
+    while sample < n_samples:
+        total = groups.total()
+        t_next = t + exponential() / total if total > 0 else math.inf
+        while sample < n_samples and timespan[sample] < t_next:
+            record(sample, x[:-1])
+            sample += 1
+            groups.refresh()
+        if sample == n_samples:
+            break
+        mu = groups.choose(total, random)
+        for s, change in changes[mu]:
+            x[s] += change
+        for k in graph[mu]:
+            groups.set(k, rates[k] * x[first[k]] * x[second[k]])
+        t = t_next
+    return x[:-1]
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+) -> np.ndarray:
+    """Exact SSA trajectories of many cells, sampled at ``timespan``.
+
+    Takes and returns the same arrays as ``batch_ssa.simulate``.
+    """
+    return run_cells(
+        _simulate_cell, A1, init, timespan, seed, network, observables, final
+    )
@@ -0,0 +1,223 @@
+"""
+Adaptive EC50 search with every dose-response evaluation memoized on disk.
+
+The tetramer response rises with ``A1``, peaks and falls again as receptors
+get split over incomplete complexes, so the EC50 is the A1 on the rising
+side where the response reaches half of its peak. ``find_ec50`` brackets the
+peak on a decade grid and refines it by successive parabolic interpolation
+in log A1. Only the peak value enters the half-maximum and it is flat near
+the optimum, so the refinement stops once that value is known to ``rtol``
+rather than its location. The half-maximum is then solved by regula falsi
+on the grid interval that brackets it on the rising side.
+
+Stochastic engines report the time-averaged tetramer counts of one cell.
+``adaptive_ec50`` only uses them where the deterministic answer is not good
+enough: it checks the stochastic response at the deterministic peak and
+EC50, and only if those differ by more than ``agreement`` does it bisect
+again with the stochastic engine, starting from the deterministic bracket.
+"""
+
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from model import ParameterValues
+from network import RECEPTOR_LEVELS, build_network
+from simulation import SOLVERS, run_chunk
+from solver_cache import CACHE_DIR, model_key
+from steady_state import steady_state
+
+ENGINES = ("steady",) + SOLVERS
+GOLDEN = (math.sqrt(5) - 1) / 2
+
+
+@dataclass
+class Evaluator:
+    """Steady tetramer count of every ligand at one A1, memoized on disk.
+
+    ``duration``, ``points``, ``burn_in`` and ``seed`` only apply to the
+    simulation engines, which average the samples after the burn-in fraction.
+    """
+
+    engine: str = "steady"
+    receptors: tuple[int, ...] = RECEPTOR_LEVELS
+    duration: float = 2000.0
+    points: int = 200
+    burn_in: float = 0.5
+    seed: int = 0
+    memo: Path | None = CACHE_DIR / "ec50"
+    evaluations: int = 0
+
+    def key(self, A1: float) -> str:
+        digest = hashlib.sha256(model_key(build_network()).encode())
+        settings = [self.engine, list(self.receptors), float(A1).hex()]
+        if self.engine != "steady":
+            settings += [self.duration, self.points, self.burn_in, self.seed]
+        digest.update(json.dumps(settings).encode())
+        return digest.hexdigest()[:24]
+
+    def _evaluate(self, A1: float) -> np.ndarray:
+        network = build_network()
+        if self.engine == "steady":
+            state = steady_state([A1], self.receptors, network)[0]
+            return network.tetramer_observables()(state)
+        timespan = np.linspace(self.duration / self.points, self.duration, self.points)
+        parameter_values = ParameterValues(
+            timespan,
+            A1,
+            network.free_state(self.receptors),
+            self.engine,
+            network.tetramer_observables(),
+        )
+        seed = np.random.SeedSequence([self.seed, int(A1 * 2**32)])
+        time, recorded, _ = run_chunk(parameter_values, np.random.default_rng(seed))
+        return recorded[time > self.burn_in * self.duration].mean(axis=0)
+
+    def __call__(self, A1: float) -> np.ndarray:
+        if self.engine not in ENGINES:
+            raise ValueError(
+                f"unknown engine {self.engine!r}, expected one of {ENGINES}"
+            )
+        path = self.memo / f"{self.key(A1)}.json" if self.memo else None
+        if path is not None and path.exists():
+            return np.array(json.loads(path.read_text()))
+        response = self._evaluate(A1)
+        self.evaluations += 1
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(f".{os.getpid()}")
+            partial.write_text(json.dumps(response.tolist()))
+            os.replace(partial, path)
+        return response
+
+
+def _peak(response, low: float, best: float, high: float, rtol: float):
+    """A1 and value of the maximum bracketed by ``low < best < high``.
+
+    ``response(best)`` must be at least that of ``low`` and ``high``. Each
+    step evaluates the vertex of the parabola in log A1 through the best
+    point and its two neighbours, or a golden-section point when the vertex
+    is too close to the best point. Stops once the parabola's maximum is
+    within ``rtol`` of the best value found.
+    """
+    (a, fa), (x, fx), (b, fb) = (
+        (math.log(A1), response(A1)) for A1 in (low, best, high)
+    )
+    while b - a > math.log1p(rtol):
+        da, db, ga, gb = a - x, b - x, fa - fx, fb - fx
+        curvature = (gb * da - ga * db) / (da * db * (db - da))
+        slope = (ga * db**2 - gb * da**2) / (da * db * (db - da))
+        if curvature >= 0 or -(slope**2) / (4 * curvature) <= rtol * fx:
+            break
+        u = x - slope / (2 * curvature)
+        if not a < u < b or abs(u - x) < 0.01 * (b - a):
+            u = x + (1 - GOLDEN) * (b - x if b - x > x - a else a - x)
+        fu = response(math.exp(u))
+        if fu >= fx:
+            if u > x:
+                a, fa = x, fx
+            else:
+                b, fb = x, fx
+            x, fx = u, fu
+        elif u > x:
+            b, fb = u, fu
+        else:
+            a, fa = u, fu
+    return math.exp(x), fx
+
+
+def _rising_crossing(response, level: float, low: float, high: float, rtol: float):
+    """Solve ``response == level`` between ``low`` and ``high`` in log A1.
+
+    Uses regula falsi with the Illinois modification, which keeps the bracket
+    of bisection but usually needs far fewer evaluations. Stops once the
+    bracket is within ``rtol`` in A1 or the response within ``rtol`` of
+    ``level``.
+    """
+    a, b = math.log(low), math.log(high)
+    fa, fb = response(low) - level, response(high) - level
+    while fa >= 0:
+        a -= math.log(10)
+        fa = response(math.exp(a)) - level
+    side = 0
+    while b - a > math.log1p(rtol):
+        c = b - fb * (b - a) / (fb - fa)
+        fc = response(math.exp(c)) - level
+        if abs(fc) <= rtol * level:
+            return math.exp(c)
+        if fc >= 0:
+            b, fb = c, fc
+            if side == 1:
+                fa /= 2
+            side = 1
+        else:
+            a, fa = c, fc
+            if side == -1:
+                fb /= 2
+            side = -1
+    return math.exp(a - fa * (b - a) / (fb - fa))
+
+
+def find_ec50(
+    ligand: str,
+    evaluate: Evaluator,
+    rtol: float = 0.01,
+    grid=np.logspace(-4, 3, 8),
+) -> tuple[float, float]:
+    """EC50 of ``ligand`` and the A1 of its peak response.
+
+    The EC50 is found to ``rtol`` in A1 and the peak response to ``rtol`` in
+    value; the peak must lie inside ``grid``.
+    """
+    index = build_network().ligands.index(ligand)
+
+    @lru_cache(maxsize=None)
+    def response(A1: float) -> float:
+        return float(evaluate(A1)[index])
+
+    values = [response(A1) for A1 in grid]
+    best = int(np.argmax(values))
+    if not 0 < best < len(grid) - 1:
+        raise ValueError(f"the {ligand} response peaks at the edge of the A1 grid")
+    peak_A1, peak = _peak(response, grid[best - 1], grid[best], grid[best + 1], rtol)
+    below = [i for i in range(best) if values[i] < peak / 2]
+    i = below[-1] if below else 0
+    return _rising_crossing(response, peak / 2, grid[i], grid[i + 1], rtol), peak_A1
+
+
+def adaptive_ec50(
+    ligand: str,
+    receptors: tuple[int, ...] = RECEPTOR_LEVELS,
+    engine: str = "steady",
+    rtol: float = 0.01,
+    agreement: float = 0.05,
+    memo: Path | None = CACHE_DIR / "ec50",
+    **settings,
+) -> float:
+    """EC50 of ``ligand`` for ``engine``, simulating only where it matters.
+
+    The deterministic EC50 is returned when the ``engine`` response at the
+    deterministic peak and EC50 agrees with the steady state within the
+    relative ``agreement``; otherwise the search is repeated with ``engine``
+    around the deterministic values.
+    """
+    steady = Evaluator("steady", receptors, memo=memo)
+    ec50, peak_A1 = find_ec50(ligand, steady, rtol)
+    if engine == "steady":
+        return ec50
+    index = build_network().ligands.index(ligand)
+    evaluate = Evaluator(engine, receptors, memo=memo, **settings)
+    checks = [(evaluate(A1)[index], steady(A1)[index]) for A1 in (peak_A1, ec50)]
+    if all(abs(s - d) <= agreement * d for s, d in checks):
+        return ec50
+
+    peak = checks[0][0]
+    return _rising_crossing(
+        lambda A1: float(evaluate(A1)[index]), peak / 2, ec50 / 2, peak_A1, rtol
+    )
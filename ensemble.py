@@ -0,0 +1,130 @@
+"""
+Replicate ensembles on a process pool, gathered in one shared array.
+
+``run_ensemble`` simulates independent replicates of every cell of a
+gradient and returns their samples as one array of shape ``(cells,
+replicates, timepoints, columns)``. The parent creates that array as a
+``.npy`` file before starting the pool; each task opens it with
+``np.load(..., mmap_mode="r+")`` and writes its cell in place, so only the
+task arguments cross the process boundary and the parent's result is a view
+of the same pages, with no copy or pickling on the way back. Without a
+``path`` the file goes to ``/dev/shm`` (or the temporary directory) and is
+unlinked as soon as the pool is done; the mapping stays valid for as long
+as the returned array is alive.
+
+    tetramers = build_network().tetramer_observables()
+    values = run_ensemble(cell_A1, 20, timespan, state, observables=tetramers)
+    # (tetramers, time, cells, replicates), as mutual_information expects
+    mi = direct_estimate(values.transpose(3, 2, 0, 1))
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from batch_ssa import output_array
+from model import ParameterValues, initial_state
+from network import Observables, RateTable, build_network
+from schedule import Schedule
+from simulation import ENGINES, SOLVERS, run_chunk
+from solver_cache import compiled_solver
+
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _start_worker(timespan: np.ndarray, init: np.ndarray, solver: str) -> None:
+    """Compile or load the SSA solver once per worker."""
+    if solver == "ssa":
+        compiled_solver(ParameterValues(timespan, 0.0, init, solver))
+
+
+def _run_cell(
+    path: str,
+    cell: int,
+    parameter_values: ParameterValues,
+    replicates: int,
+    seed: np.random.SeedSequence,
+) -> None:
+    """Simulate the replicates of one cell into row ``cell`` of the array at ``path``."""
+    out = np.load(path, mmap_mode="r+")[cell]
+    rng = np.random.default_rng(seed)
+    if parameter_values.solver in ENGINES and not isinstance(
+        parameter_values.A1, Schedule
+    ):
+        # the NumPy engines run all replicates of a cell as one batch
+        out[:] = ENGINES[parameter_values.solver](
+            np.full(replicates, parameter_values.A1),
+            initial_state(parameter_values.init),
+            np.asarray(parameter_values.timespan, dtype=float),
+            seed=rng,
+            network=parameter_values.network(),
+            observables=parameter_values.observables,
+        )
+    else:
+        for replicate in range(replicates):
+            out[replicate] = run_chunk(parameter_values, rng)[1]
+    out.flush()
+
+
+def run_ensemble(
+    cell_A1: list[float | Schedule] | np.ndarray,
+    replicates: int,
+    timespan: np.ndarray,
+    init: pd.DataFrame | np.ndarray,
+    solver: str = "batch",
+    observables: Observables | None = None,
+    rates: RateTable | None = None,
+    seed: int | None = None,
+    workers: int | None = None,
+    path: str | Path | None = None,
+) -> np.ndarray:
+    """Samples of ``replicates`` runs of each cell, ``(cells, replicates, time, columns)``.
+
+    Columns are the ``observables``, or all species in network order. Every
+    cell is a task on the pool and gets its own random stream. With ``path``
+    the result is kept there as a ``.npy`` file that ``np.load`` can map
+    again later.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"unknown solver {solver!r}, expected one of {SOLVERS}")
+    init = initial_state(init)
+    timespan = np.asarray(timespan, dtype=float)
+    sample = output_array(0, timespan, build_network(), observables)
+    dtype = float if solver == "ode" else sample.dtype
+    shape = (len(cell_A1), replicates) + sample.shape[1:]
+
+    temporary = path is None
+    if temporary:
+        handle, path = tempfile.mkstemp(suffix=".npy", dir=SHARED_DIR)
+        os.close(handle)
+    path = str(path)
+    values = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    values.flush()  # the header must be on disk before a worker opens the file
+    seeds = np.random.SeedSequence(seed).spawn(len(cell_A1))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_start_worker,
+            initargs=(timespan, init, solver),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _run_cell,
+                    path,
+                    cell,
+                    ParameterValues(timespan, A1, init, solver, observables, rates),
+                    replicates,
+                    cell_seed,
+                )
+                for cell, (A1, cell_seed) in enumerate(zip(cell_A1, seeds))
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        if temporary:
+            os.unlink(path)
+    return values
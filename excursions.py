@@ -0,0 +1,113 @@
+"""
+Lengths of departures from the mean (Figure 3c/3d).
+
+A departure is a run of consecutive samples more than ``threshold`` standard
+deviations above (or below) the mean of its series. ``Excursions`` finds the
+runs of every series in a chunk with one run-length encoding of the whole
+chunk, and carries the run that is still open at the end of a chunk into the
+next one. Only the length histograms and one open run per series are kept,
+so full 240-hour trajectories are never in memory.
+"""
+
+import numpy as np
+
+from trajectory_store import cells, iter_chunks
+
+
+class Excursions:
+    """Online histograms of departure lengths for many series.
+
+    ``mean`` and ``std`` have the leading shape of the samples passed to
+    ``update`` (``(..., timepoints)``). ``counts[..., n]`` is the number of
+    departures lasting ``n`` samples; the last bin collects every departure
+    of ``max_length`` samples or more.
+    """
+
+    def __init__(self, mean, std, threshold: float = 1.0, max_length: int = 1000):
+        self.mean = np.asarray(mean, dtype=float)
+        self.bound = threshold * np.asarray(std, dtype=float)
+        self.max_length = max_length
+        shape = self.mean.shape
+        self.counts = np.zeros(shape + (max_length + 1,), dtype=np.int64)
+        self.open_side = np.zeros(shape, dtype=np.int8)
+        self.open_length = np.zeros(shape, dtype=np.int64)
+
+    def _add(self, series: np.ndarray, lengths: np.ndarray) -> None:
+        flat = self.counts.reshape(-1, self.max_length + 1)
+        np.add.at(flat, (series, np.minimum(lengths, self.max_length)), 1)
+
+    def update(self, values: np.ndarray) -> None:
+        deviation = np.asarray(values, dtype=float) - self.mean[..., None]
+        if deviation.shape[-1] == 0:
+            return
+        bound = self.bound[..., None]
+        side = np.where(deviation > bound, 1, np.where(deviation < -bound, -1, 0))
+        side = side.reshape(-1, side.shape[-1]).astype(np.int8)
+        n_series, n_samples = side.shape
+
+        # run-length encode every row at once
+        starts = np.ones(side.shape, dtype=bool)
+        starts[:, 1:] = side[:, 1:] != side[:, :-1]
+        run_series, run_start = np.nonzero(starts)
+        run_side = side[run_series, run_start]
+        run_end = np.append(run_start[1:], n_samples)
+        last = np.append(run_series[1:] != run_series[:-1], True)
+        run_end[last] = n_samples
+        lengths = run_end - run_start
+
+        # the open run of the previous chunk continues or ends here
+        open_side = self.open_side.reshape(-1)
+        open_length = self.open_length.reshape(-1)
+        first = run_start == 0
+        continued = first & (run_side == open_side[run_series]) & (run_side != 0)
+        lengths[continued] += open_length[run_series[continued]]
+        ended = (open_side != 0) & ~np.isin(np.arange(n_series), run_series[continued])
+        self._add(np.flatnonzero(ended), open_length[ended])
+
+        closed = ~last & (run_side != 0)
+        self._add(run_series[closed], lengths[closed])
+        open_side[:] = run_side[last]
+        open_length[:] = lengths[last]
+
+    def finish(self) -> np.ndarray:
+        """Count the departures still open at the end and return the histograms."""
+        open_side = self.open_side.reshape(-1)
+        ended = open_side != 0
+        self._add(np.flatnonzero(ended), self.open_length.reshape(-1)[ended])
+        open_side[:] = 0
+        self.open_length[...] = 0
+        return self.counts
+
+
+def _moments(root: str, run: str, columns: list[str], cell_numbers: list[int]):
+    """Mean and sample standard deviation of every cell and column, streamed."""
+    n, mean, m2 = 0, 0.0, 0.0
+    for _, values in iter_chunks(root, run, columns, cell_numbers):
+        k = values.shape[1]
+        chunk_mean = values.mean(axis=1)
+        chunk_m2 = ((values - chunk_mean[:, None]) ** 2).sum(axis=1)
+        delta = chunk_mean - mean
+        m2 = m2 + chunk_m2 + delta**2 * n * k / (n + k)
+        mean = mean + delta * k / (n + k)
+        n += k
+    return mean, np.sqrt(m2 / (n - 1))
+
+
+def departure_lengths(
+    root: str,
+    run: str,
+    columns: list[str],
+    threshold: float = 1.0,
+    max_length: int = 1000,
+) -> np.ndarray:
+    """Departure-length histograms of a stored run, ``(cells, columns, lengths)``.
+
+    Makes two streamed passes: one for each series' mean and standard
+    deviation over the whole run, one for the departures.
+    """
+    cell_numbers = cells(root, run)
+    mean, std = _moments(root, run, columns, cell_numbers)
+    excursions = Excursions(mean, std, threshold, max_length)
+    for _, values in iter_chunks(root, run, columns, cell_numbers):
+        excursions.update(values.transpose(0, 2, 1))
+    return excursions.finish()
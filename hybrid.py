@@ -0,0 +1,162 @@
+"""
+Hybrid engine: fast binding equilibria in quasi-steady state, the rest exact.
+
+Every assembly step ``C + R <-> T`` (``R`` a free receptor) is reversible and
+the ones scaled by ``Boost_up`` fire back and forth far more often than
+anything around them changes. Following the slow-scale SSA of Cao, Gillespie
+& Petzold (2005), such a pair is taken to be at equilibrium between the other
+("slow") events: with the abundant receptor held fixed, the ``n = C + T``
+complexes split binomially, ``C ~ Binomial(n, k_off / (k_on R + k_off))``.
+The engine then only simulates the slow reactions, by exact SSA, and
+redraws every fast pair from its equilibrium after each slow event.
+
+The partition is redone in every cell at each of its sample times and
+at the start: a pair is fast when both
+directions fire at least ``FAST_RATIO`` times as often as all slow reactions
+that touch its complexes, and the receptor outnumbers the complexes so it
+can be held fixed. Pairs sharing a complex compete and only the
+fastest of them is equilibrated, so the fast pairs never overlap. Cells with
+no fast pair run plain SSA.
+"""
+
+import numpy as np
+
+from batch_ssa import (
+    choose_reaction,
+    output_array,
+    propensities,
+    record_samples,
+    with_ones,
+)
+from network import Network, Observables, build_network
+
+FAST_RATIO = 3.0
+
+
+def binding_pairs(network: Network) -> np.ndarray:
+    """``(forward, reverse, complex, receptor, product)`` of every ``C + R <-> T``."""
+    receptors = [network.species_index(r) for r in network.receptors]
+    reverse = {}
+    for j in range(network.n_reactions):
+        lhs, rhs = network.reactants[j], network.products[j]
+        reverse[tuple(sorted(lhs[lhs >= 0])), tuple(sorted(rhs[rhs >= 0]))] = j
+    pairs = []
+    for j in range(network.n_reactions):
+        lhs, rhs = network.reactants[j], network.products[j]
+        rhs = rhs[rhs >= 0]
+        if (lhs < 0).any() or len(rhs) != 1 or lhs[1] not in receptors:
+            continue
+        back = reverse.get(((rhs[0],), tuple(sorted(lhs))))
+        if back is not None:
+            pairs.append((j, back, lhs[0], lhs[1], rhs[0]))
+    return np.array(pairs, dtype=np.int64).reshape(-1, 5)
+
+
+def pair_members(pairs: np.ndarray, n_species: int) -> np.ndarray:
+    """Pairs holding each species as complex or product, padded with -1."""
+    members = [[] for _ in range(n_species)]
+    for index, (_, _, complex_, _, product) in enumerate(pairs):
+        members[complex_].append(index)
+        members[product].append(index)
+    width = max(map(len, members))
+    return np.array([m + [-1] * (width - len(m)) for m in members])
+
+
+def fast_pairs(a, state, pairs, touches, members) -> np.ndarray:
+    """Which binding pairs each cell equilibrates, shape ``(cells, pairs)``."""
+    forward, reverse, complex_, receptor, product = pairs.T
+    a_pair = a[:, forward] + a[:, reverse]
+    # firing rate of everything else that changes C or T
+    species_rate = a @ touches
+    slow = species_rate[:, complex_] + species_rate[:, product] - 2 * a_pair
+    candidate = np.minimum(a[:, forward], a[:, reverse]) >= FAST_RATIO * slow
+    # the receptor must be able to absorb any split of the complexes
+    total = state[:, complex_] + state[:, product]
+    candidate &= (a_pair > 0) & (state[:, receptor] >= total)
+    # a padded column of -inf stands in for the missing members
+    score = np.where(candidate, a_pair, -np.inf)
+    best = np.pad(score, ((0, 0), (0, 1)), constant_values=-np.inf)
+    best = best[:, members].max(axis=2)
+    return candidate & (score >= best[:, complex_]) & (score >= best[:, product])
+
+
+def equilibrate(state, rates, pairs, fast, rng) -> None:
+    """Redraw the complexes of every fast pair from its equilibrium, in place."""
+    rows, p = np.nonzero(fast)
+    if not len(rows):
+        return
+    forward, reverse, complex_, receptor, product = pairs[p].T
+    on = rates[rows, forward] * state[rows, receptor]
+    off = rates[rows, reverse]
+    total = state[rows, complex_] + state[rows, product]
+    unbound = rng.binomial(total, off / (on + off))
+    bound = total - unbound
+    shift = bound - state[rows, product]
+    state[rows, complex_] = unbound
+    state[rows, product] = bound
+    # several pairs can share a receptor
+    flat = rows * state.shape[1] + receptor
+    taken = np.bincount(flat, shift, state.size).reshape(state.shape)
+    state -= taken.astype(state.dtype)
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+) -> np.ndarray:
+    """Hybrid trajectories of many cells, sampled at ``timespan``.
+
+    Takes and returns the same arrays as ``batch_ssa.simulate``.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    n_cells, n_species = len(A1), network.n_species
+    rates = network.rates(A1)
+    state = with_ones(np.broadcast_to(init, (n_cells, n_species)).astype(np.int64))
+    stoichiometry = np.pad(network.stoichiometry, ((0, 0), (0, 1)))
+    pairs = binding_pairs(network)
+    members = pair_members(pairs, n_species + 1)
+    touches = np.pad(network.stoichiometry != 0, ((0, 0), (0, 1))).astype(float)
+    in_pair = np.zeros((len(pairs), network.n_reactions))
+    in_pair[np.arange(len(pairs)), pairs[:, 0]] = 1.0
+    in_pair[np.arange(len(pairs)), pairs[:, 1]] = 1.0
+    rng = np.random.default_rng(seed)
+
+    out = output_array(n_cells, timespan, network, observables)
+    time = np.zeros(n_cells)
+    sample = np.zeros(n_cells, dtype=np.int64)
+    fast = np.zeros((n_cells, len(pairs)), dtype=bool)
+    slow = np.ones((n_cells, network.n_reactions))
+    stale = np.ones(n_cells, dtype=bool)
+    cells = np.arange(n_cells)
+    while len(cells):
+        x = state[cells]
+        if stale[cells].any():
+            redo = cells[stale[cells]]
+            a = propensities(network, rates[redo], state[redo])
+            fast[redo] = fast_pairs(a, state[redo], pairs, touches, members)
+            slow[redo] = 1.0 - fast[redo] @ in_pair
+        equilibrate(x, rates[cells], pairs, fast[cells], rng)
+        state[cells] = x
+        a = propensities(network, rates[cells], x) * slow[cells]
+
+        total = a.sum(axis=1)
+        with np.errstate(divide="ignore"):
+            next_time = time[cells] + rng.exponential(1.0, len(cells)) / total
+        recorded = sample[cells]
+        record_samples(
+            out, state, sample, timespan, cells, next_time, observables, final
+        )
+        # repartition whenever a cell passes a sample time
+        stale[cells] = sample[cells] != recorded
+        firing = np.isfinite(next_time)
+        reaction = choose_reaction(a, total, rng)
+        state[cells[firing]] += stoichiometry[reaction[firing]]
+        time[cells] = next_time
+        cells = cells[sample[cells] < len(timespan)]
+    return out
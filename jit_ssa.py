@@ -0,0 +1,116 @@
+"""
+Direct-method SSA compiled with Numba, driven by the network arrays.
+
+Unlike the gillespy2 solver nothing is generated per model: the kernel takes
+the reactant indices, the sparse stoichiometry, the reaction dependency
+graph and a rate vector as plain arrays, so one compiled kernel serves every
+A1, initial state and rate variant. Numba caches the machine code on disk
+(under ``CACHE_DIR/numba`` unless ``NUMBA_CACHE_DIR`` says otherwise), so
+only the first call on a machine pays for compilation.
+
+After an event only the propensities in the fired reaction's dependency
+graph entry are recomputed and the total is updated by their difference; it
+is summed afresh at every sample time so rounding errors cannot build up.
+"""
+
+import numba
+import numpy as np
+
+from batch_ssa import output_array
+from network import Network, Observables, build_network
+from next_reaction import dependency_graph
+from solver_cache import CACHE_DIR
+
+# read when the kernel below is decorated, so set it first
+numba.config.CACHE_DIR = numba.config.CACHE_DIR or str(CACHE_DIR / "numba")
+
+
+def _csr(rows: list[list]) -> tuple[np.ndarray, np.ndarray]:
+    """Row pointers and concatenated entries of a ragged list."""
+    indptr = np.cumsum([0] + [len(row) for row in rows])
+    return indptr, np.array([v for row in rows for v in row], dtype=np.int64)
+
+
+@numba.njit(cache=True)
+def _kernel(rates, reactants, change_ptr, change, dep_ptr, dep, state, timespan, seed):
+    """Simulate every row of ``rates`` from the matching row of ``state``.
+
+    ``state`` has a trailing column of ones for the padded reactants and is
+    left at the counts of the last sample; ``change`` holds ``(species,
+    delta)`` rows. Returns the counts at every sample time.
+    """
+    np.random.seed(seed)
+    n_cells, n_reactions = rates.shape
+    n_species = state.shape[1] - 1
+    out = np.empty((n_cells, len(timespan), n_species), dtype=np.int64)
+    a = np.empty(n_reactions)
+    for cell in range(n_cells):
+        x, k = state[cell], rates[cell]
+        for j in range(n_reactions):
+            a[j] = k[j] * x[reactants[j, 0]] * x[reactants[j, 1]]
+        total = a.sum()
+        t, sample = 0.0, 0
+        while sample < len(timespan):
+            step = np.random.exponential() / total if total > 0 else np.inf
+            while sample < len(timespan) and timespan[sample] < t + step:
+                out[cell, sample] = x[:n_species]
+                sample += 1
+                total = a.sum()
+            if sample == len(timespan):
+                break
+            threshold = np.random.random() * total
+            mu = 0
+            while mu < n_reactions - 1 and threshold >= a[mu]:
+                threshold -= a[mu]
+                mu += 1
+            for i in range(change_ptr[mu], change_ptr[mu + 1]):
+                x[change[i, 0]] += change[i, 1]
+            for i in range(dep_ptr[mu], dep_ptr[mu + 1]):
+                j = dep[i]
+                new = k[j] * x[reactants[j, 0]] * x[reactants[j, 1]]
+                total += new - a[j]
+                a[j] = new
+            t += step
+    return out
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+) -> np.ndarray:
+    """Exact SSA trajectories of many cells, sampled at ``timespan``.
+
+    Takes and returns the same arrays as ``batch_ssa.simulate``.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    n_cells, n_species = len(A1), network.n_species
+    state = np.ones((n_cells, n_species + 1), dtype=np.int64)
+    state[:, :-1] = np.broadcast_to(init, (n_cells, n_species))
+    change_ptr, change = _csr(
+        [[(s, row[s]) for s in np.flatnonzero(row)] for row in network.stoichiometry]
+    )
+    dep_ptr, dep = _csr(dependency_graph(network))
+    seed = int(np.random.default_rng(seed).integers(2**31 - 1))
+
+    counts = _kernel(
+        network.rates(A1),
+        network.reactants,
+        change_ptr,
+        change,
+        dep_ptr,
+        dep,
+        state,
+        np.asarray(timespan, dtype=float),
+        seed,
+    )
+    if final is not None:
+        final[:] = state[:, :-1]
+    out = output_array(n_cells, timespan, network, observables)
+    out[:] = counts if observables is None else observables(counts)
+    return out
@@ -3,10 +3,11 @@ import numpy as np
 import pandas as pd
 import sys  # library that allows into from operating system
 from datetime import datetime
-from gillespy2 import Model
-from gillespy2.core.results import Results
 
-from model import SomeModel, ParameterValues
+from checkpoint import Checkpoint, load
+from model import ParameterValues, initial_state
+from simulation import run_chunk
+from trajectory_store import append
 
 startTime = time.time()
 print(str(datetime.now()))
@@ -15,27 +16,44 @@ print(sys.argv)
 A1 = float(sys.argv[1])
 cellNo = eval(sys.argv[2])
 tp = eval(sys.argv[3])
+solver = sys.argv[4] if len(sys.argv) > 4 else "ssa"
+runName = sys.argv[5] if len(sys.argv) > 5 else "run"
 
-filename = "testData4_cn" + str(cellNo) + ".csv"
+storename = "trajectories"
+checkpointname = "state_cn" + str(cellNo) + ".npz"
 
 if tp == 0:
     header = pd.read_csv("initBook.csv")
-    header.to_csv(filename)
+    checkpoint = Checkpoint(initial_state(header), 0.0, np.random.default_rng())
+else:
+    checkpoint = load(checkpointname)
 
 initReceptors = [3500, 3500, 7000]
 
 sys.path[:0] = [".."]
 
-model: Model = SomeModel(
-    ParameterValues(A1=A1, init=pd.read_csv(filename)),
-    timespan=np.linspace(1, 100, 100),
+timespan = np.linspace(1, 100, 100)
+sampleTimes, results, checkpoint.state = run_chunk(
+    ParameterValues(
+        timespan=timespan,
+        A1=A1,
+        init=checkpoint.state,
+        solver=solver,
+    ),
+    seed=checkpoint.rng,
 )
-results: Results = model.run()
 
-results = results.to_array()
 print(results.shape)
-results1 = results.reshape(-1, results.shape[2])
-df_results = pd.DataFrame(results1)
-df_results.to_csv(filename, header=False, mode="a")
+append(
+    storename,
+    runName,
+    cellNo,
+    tp,
+    checkpoint.time + sampleTimes,
+    results,
+)
+
+checkpoint.time += timespan[-1]
+checkpoint.save(checkpointname)
 
 print("The script took {0} second !".format(time.time() - startTime))
@@ -0,0 +1,163 @@
+"""
+Direct estimate of positional information, ported from ``midirectestimate.m``.
+
+For every bin count and subsample size the MATLAB code draws ``n_boots``
+subsets of replicates without replacement, bins position and readout into a
+joint histogram and evaluates Eq. 24 of Tkačik et al. (2015). Here the joint
+histogram of every replicate (at every time point or other leading axis) is
+built in one ``np.bincount`` pass, and the histograms of all bootstrap
+subsets follow from a single matrix product with their 0/1 membership
+matrix. Independent trials run on a process pool, and ``extrapolate`` takes
+the naive estimates to infinite data and zero bin size.
+
+Unlike ``histcountsn``, which fits the readout bins to each subset, the bins
+span the range of all replicates, so every subset and subsample size of a
+data set shares the same bins.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+BIN_COUNTS = tuple(range(2, 11))
+SUBSAMPLES = (0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+N_BOOTS = 50
+
+
+@dataclass
+class NaiveEstimates:
+    """Naive MI (bits) of each trial, shape ``(trials, ..., bins, subsamples)``."""
+
+    bin_counts: tuple[int, ...]
+    subsample_sizes: tuple[int, ...]
+    means: np.ndarray
+    stds: np.ndarray
+
+
+def _bin(values: np.ndarray, low, high, n_bins: int) -> np.ndarray:
+    """Index of the equal-width bin of each value, the maximum in the last bin."""
+    width = np.where(high > low, high - low, 1.0)
+    index = np.floor((values - low) / width * n_bins).astype(np.int64)
+    return np.clip(index, 0, n_bins - 1)
+
+
+def naive_mi(
+    y: np.ndarray,
+    n_bins: int,
+    size: int,
+    n_boots: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Eq. 24 for ``n_boots`` subsets of ``size`` replicates, ``(..., n_boots)``.
+
+    ``y`` has shape ``(..., positions, replicates)``; positions are taken to be
+    evenly spaced and uniformly distributed, as in the MATLAB code.
+    """
+    *batch, n_x, n_e = y.shape
+    y = y.reshape(-1, n_x, n_e)
+    low = y.min(axis=(1, 2), keepdims=True)
+    high = y.max(axis=(1, 2), keepdims=True)
+    g = _bin(y, low, high, n_bins)
+    # integer arithmetic so positions on a bin edge are never rounded down
+    xb = np.minimum(np.arange(n_x) * n_bins // max(n_x - 1, 1), n_bins - 1)
+
+    # joint histogram of every single replicate, then of each subset by a sum
+    replicate = np.arange(len(y) * n_e).reshape(len(y), 1, n_e)
+    code = (replicate * n_bins + xb[:, None]) * n_bins + g
+    single = np.bincount(code.ravel(), minlength=len(y) * n_e * n_bins**2)
+    single = single.reshape(len(y), n_e, n_bins**2).astype(float)
+    picks = np.argsort(rng.random((n_boots, n_e)), axis=1)[:, :size]
+    chosen = np.zeros((n_boots, n_e))
+    chosen[np.arange(n_boots)[:, None], picks] = 1.0
+
+    joint = (chosen @ single).reshape(len(y), n_boots, n_bins, n_bins)
+    joint = joint / (n_x * size) + np.finfo(float).eps
+    pg = joint.sum(axis=2, keepdims=True)
+    px = 1.0 / n_bins
+    mi = (joint * np.log2(joint / (px * pg))).sum(axis=(2, 3))
+    return mi.reshape(*batch, n_boots)
+
+
+def _trial(y, bin_counts, sizes, n_boots, seed) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    shape = y.shape[:-2] + (len(bin_counts), len(sizes))
+    means, stds = np.empty(shape), np.empty(shape)
+    for i, n_bins in enumerate(bin_counts):
+        for j, size in enumerate(sizes):
+            mi = naive_mi(y, n_bins, size, n_boots, rng)
+            means[..., i, j] = mi.mean(axis=-1)
+            stds[..., i, j] = mi.std(axis=-1, ddof=1) if n_boots > 1 else 0.0
+    return means, stds
+
+
+def direct_estimate(
+    y: np.ndarray,
+    n_trials: int = 1,
+    n_boots: int = N_BOOTS,
+    bin_counts: tuple[int, ...] = BIN_COUNTS,
+    subsamples: tuple[float, ...] = SUBSAMPLES,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> NaiveEstimates:
+    """Naive estimates of ``midirectestimate(y, nTrials, nBoots, ...)``.
+
+    ``y`` is ``(..., positions, replicates)``; leading axes are estimated
+    independently. Trials run in parallel when there is more than one.
+    """
+    y = np.asarray(y, dtype=float)
+    sizes = tuple(int(round(s * y.shape[-1])) for s in subsamples)
+    seeds = np.random.SeedSequence(seed).spawn(n_trials)
+    args = [(y, tuple(bin_counts), sizes, n_boots, s) for s in seeds]
+    if n_trials == 1:
+        results = [_trial(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            results = list(pool.map(_trial, *zip(*args)))
+    means, stds = (np.stack(r) for r in zip(*results))
+    return NaiveEstimates(tuple(bin_counts), sizes, means, stds)
+
+
+def _intercept(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Intercept of least-squares lines through ``(x, y)`` along the last axis."""
+    xm, ym = x.mean(), y.mean(axis=-1, keepdims=True)
+    slope = ((x - xm) * (y - ym)).sum(axis=-1) / ((x - xm) ** 2).sum()
+    return ym[..., 0] - slope * xm
+
+
+def extrapolate(estimates: NaiveEstimates) -> tuple[np.ndarray, np.ndarray]:
+    """MI at infinite data for each bin count, and its zero-bin-size limit.
+
+    The naive means are linear in 1/N for large subsets of N replicates, so
+    the first result is the intercept of that fit, averaged over
+    trials, shape ``(..., bins)``. The second extrapolates those values
+    linearly in bin width (1 / bin count) to zero, shape ``(...)``.
+    """
+    inverse_size = 1.0 / np.asarray(estimates.subsample_sizes, dtype=float)
+    infinite_data = _intercept(inverse_size, estimates.means).mean(axis=0)
+    width = 1.0 / np.asarray(estimates.bin_counts, dtype=float)
+    return infinite_data, _intercept(width, infinite_data)
+
+
+def mi_over_time(
+    frame: pd.DataFrame, columns: list[str], **options
+) -> dict[str, np.ndarray]:
+    """Extrapolated MI at every time point for each readout column.
+
+    ``frame`` comes from ``trajectory_store.read``: cells are the positions
+    and runs the replicates. Returns ``{column: MI(t)}``, like one row of
+    ``MI_t_all`` per column.
+    """
+    times = np.sort(frame["time"].unique())
+    cells = np.sort(frame["cell"].unique())
+    runs = np.sort(frame["run"].unique())
+    index = pd.MultiIndex.from_product([times, cells, runs])
+    frame = frame.drop_duplicates(["time", "cell", "run"], keep="last")
+    frame = frame.set_index(["time", "cell", "run"]).reindex(index)
+    result = {}
+    for column in columns:
+        y = frame[column].to_numpy(float).reshape(len(times), len(cells), len(runs))
+        result[column] = extrapolate(direct_estimate(y, **options))[1]
+    return result
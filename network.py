@@ -0,0 +1,420 @@
+"""
+Rule-based generator for the BMP receptor oligomerization network.
+
+A ligand (BMP2, BMP7 or the BMP2/7 heterodimer BMP27) first binds one free
+receptor and the complex then grows one receptor at a time, holding at most
+two type I receptors (Alk3, Alk8) and two type II receptors (RII). Every
+assembly step is reversible and every ligand-bound complex is endocytosed,
+returning its receptors to the free pool.
+
+The association/dissociation constant of a step only depends on the ligand,
+the receptor that joins and whether it is the first or second copy of that
+receptor in the complex (the ``1r3on/off`` and ``2r3on/off`` columns of the
+table in ``model.py``). The free ligand is not a species: its effective
+concentration ``A1`` is folded into the first-step propensities, so every
+rate is ``rate_constant + A1 * rate_ligand``.
+"""
+
+import itertools
+import tomllib
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+LIGANDS = ("BMP2", "BMP7", "BMP27")
+RECEPTORS = ("Alk3", "Alk8", "RII")
+
+# receptor class and the number of receptors of each class a complex can hold
+RECEPTOR_TYPES = {"Alk3": "I", "Alk8": "I", "RII": "II"}
+MAX_PER_TYPE = {"I": 2, "II": 2}
+
+# free Alk3, Alk8 and RII per cell in the reference simulations
+RECEPTOR_LEVELS = (3500, 3500, 7000)
+
+# the assembly steps of ``RECEPTORS`` as numbered in the table in ``model.py``;
+# the numbers name each step's rate parameters (kN, kNr) and reactions
+TABLE_STEPS = (
+    ((), "Alk3"),
+    ((), "Alk8"),
+    ((), "RII"),
+    (("Alk3",), "Alk3"),
+    (("Alk3",), "Alk8"),
+    (("Alk3",), "RII"),
+    (("Alk8",), "Alk3"),
+    (("Alk8",), "Alk8"),
+    (("Alk8",), "RII"),
+    (("RII",), "Alk3"),
+    (("RII",), "Alk8"),
+    (("RII",), "RII"),
+    (("Alk8", "Alk8"), "RII"),
+    (("RII", "RII"), "Alk3"),
+    (("RII", "RII"), "Alk8"),
+    (("Alk3", "Alk3"), "RII"),
+    (("Alk3", "Alk8"), "RII"),
+    (("Alk3", "RII"), "Alk3"),
+    (("Alk3", "RII"), "Alk8"),
+    (("Alk3", "RII"), "RII"),
+    (("Alk8", "RII"), "Alk3"),
+    (("Alk8", "RII"), "Alk8"),
+    (("Alk8", "RII"), "RII"),
+    (("Alk3", "Alk3", "RII"), "RII"),
+    (("Alk3", "Alk8", "RII"), "RII"),
+    (("Alk3", "RII", "RII"), "Alk3"),
+    (("Alk3", "RII", "RII"), "Alk8"),
+    (("Alk8", "Alk8", "RII"), "RII"),
+    (("Alk8", "RII", "RII"), "Alk3"),
+    (("Alk8", "RII", "RII"), "Alk8"),
+)
+# the table names the RII binding constants kN rather than kNA
+UNSUFFIXED_STEPS = {((), "RII")}
+
+RATE_TABLE = Path(__file__).with_name("rates.toml")
+AVOGADRO = 6.022e23
+# how each reaction's constant is looked up in a ``RateTable``
+BIND, ON, OFF, ENDOCYTOSIS = range(4)
+
+
+@dataclass(frozen=True)
+class RateTable:
+    """Every kinetic constant as arrays, indexed by ligand.
+
+    ``bind`` (ligands x receptors) are the ligand-receptor association
+    constants (multiplied by ``A1``); ``on``/``off`` (ligands x 2 x
+    receptors) hold the constants for the first and second copy of a receptor
+    joining an existing complex, receptors ordered like ``RECEPTORS``.
+    """
+
+    ligands: tuple[str, ...]
+    tags: tuple[str, ...]
+    endocytosis_parameters: tuple[str, ...]
+    bind: np.ndarray
+    on: np.ndarray
+    off: np.ndarray
+    endocytosis: np.ndarray
+    volume: float
+    boost_up: float
+
+    @property
+    def stoch(self) -> float:
+        """Conversion of nM association constants to per-molecule rates."""
+        return 1e9 / (AVOGADRO * self.volume)
+
+    def override(self, **overrides: float) -> "RateTable":
+        """Copy with named changes.
+
+        ``volume`` and ``boost_up`` replace the scalings;
+        ``<ligand>_<bind|on|off|endocytosis>_scale`` multiply every constant
+        of that kind for one ligand, e.g. ``BMP7_off_scale=2.0``.
+        """
+        scalings = {}
+        arrays = {}
+        for name, value in overrides.items():
+            if name in ("volume", "boost_up"):
+                scalings[name] = float(value)
+                continue
+            ligand, _, kind = name.removesuffix("_scale").rpartition("_")
+            if (
+                not name.endswith("_scale")
+                or ligand not in self.ligands
+                or kind not in ("bind", "on", "off", "endocytosis")
+            ):
+                raise ValueError(f"unknown rate override {name!r}")
+            array = arrays.setdefault(kind, getattr(self, kind).copy())
+            array[self.ligands.index(ligand)] *= value
+        return replace(self, **arrays, **scalings)
+
+
+def load_rates(path: str | Path = RATE_TABLE) -> RateTable:
+    """Read a rate table from TOML, see ``rates.toml``."""
+    with open(path, "rb") as file:
+        table = tomllib.load(file)
+    scaling = table.pop("scaling")
+    ligands = tuple(table)
+    return RateTable(
+        ligands=ligands,
+        tags=tuple(table[li]["tag"] for li in ligands),
+        endocytosis_parameters=tuple(
+            table[li]["endocytosis_parameter"] for li in ligands
+        ),
+        bind=np.array([table[li]["bind"] for li in ligands], dtype=float),
+        on=np.array([table[li]["on"] for li in ligands], dtype=float),
+        off=np.array([table[li]["off"] for li in ligands], dtype=float),
+        endocytosis=np.array([table[li]["endocytosis_rate"] for li in ligands]),
+        volume=float(scaling["volume"]),
+        boost_up=float(scaling["boost_up"]),
+    )
+
+
+DEFAULT_RATES = load_rates()
+VOLUME = DEFAULT_RATES.volume
+STOCH = DEFAULT_RATES.stoch
+BOOST_UP = DEFAULT_RATES.boost_up
+
+
+@dataclass(frozen=True)
+class Observables:
+    """Named linear combinations of species counts.
+
+    ``weights`` (S x K) maps a state to the observables, so recording
+    ``state @ weights`` keeps K columns instead of all S species.
+    """
+
+    names: tuple[str, ...]
+    weights: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __call__(self, counts: np.ndarray) -> np.ndarray:
+        return counts @ self.weights
+
+
+@dataclass(frozen=True)
+class Network:
+    """Species, stoichiometry and rate assignments as flat arrays.
+
+    ``reactants`` (R x 2) and ``products`` (R x 4) hold species indices,
+    padded with -1; a species listed twice has stoichiometry 2.
+    ``species_ligand`` is the ligand index of each species (-1 for free
+    receptors) and ``composition`` (S x receptors) counts the receptors it
+    holds, so ``state @ composition`` are the conserved receptor totals.
+    ``rate_source`` (R x 4) says where each rate comes from in a
+    ``RateTable``: its kind (``BIND``, ``ON``, ``OFF`` or ``ENDOCYTOSIS``),
+    the table's ligand index, the receptor copy and the receptor index.
+    """
+
+    species: tuple[str, ...]
+    receptors: tuple[str, ...]
+    ligands: tuple[str, ...]
+    species_ligand: np.ndarray
+    composition: np.ndarray
+    reaction_names: tuple[str, ...]
+    rate_names: tuple[str, ...]
+    reactants: np.ndarray
+    products: np.ndarray
+    stoichiometry: np.ndarray
+    rate_source: np.ndarray
+    rate_constant: np.ndarray
+    rate_ligand: np.ndarray
+
+    @property
+    def n_species(self) -> int:
+        return len(self.species)
+
+    @property
+    def n_reactions(self) -> int:
+        return len(self.reaction_names)
+
+    def species_index(self, name: str) -> int:
+        return self.species.index(name)
+
+    def tetramers(self, ligand: str) -> np.ndarray:
+        """Indices of the fully assembled signaling complexes of ``ligand``."""
+        size = self.composition.sum(axis=1)
+        mine = self.species_ligand == self.ligands.index(ligand)
+        return np.flatnonzero(mine & (size == size.max()))
+
+    def observables(self, definitions: dict[str, dict[str, float]]) -> Observables:
+        """Observables from ``{name: {species: weight}}``.
+
+        Weights stay integers when they all are, so integer counts project to
+        integer observables.
+        """
+        weights = np.zeros((self.n_species, len(definitions)))
+        for k, terms in enumerate(definitions.values()):
+            for name, weight in terms.items():
+                weights[self.species_index(name), k] = weight
+        if np.array_equal(weights, np.round(weights)):
+            weights = weights.astype(np.int64)
+        return Observables(tuple(definitions), weights)
+
+    def tetramer_observables(self) -> Observables:
+        """Total signaling complexes of each ligand, ``<ligand>_tetramers``."""
+        return self.observables(
+            {
+                f"{ligand}_tetramers": {
+                    self.species[i]: 1 for i in self.tetramers(ligand)
+                }
+                for ligand in self.ligands
+            }
+        )
+
+    def free_state(self, levels=RECEPTOR_LEVELS) -> np.ndarray:
+        """Initial counts with only free, unbound receptors."""
+        state = np.zeros(self.n_species, dtype=np.int64)
+        state[[self.species_index(r) for r in self.receptors]] = levels
+        return state
+
+    def rates(self, A1) -> np.ndarray:
+        """Rate constant of every reaction, shape ``np.shape(A1) + (R,)``."""
+        return np.multiply.outer(A1, self.rate_ligand) + self.rate_constant
+
+    def with_rates(self, table: RateTable) -> "Network":
+        """The same network with every rate taken from ``table``."""
+        constant, ligand = rate_vectors(table, self.rate_source)
+        return replace(self, rate_constant=constant, rate_ligand=ligand)
+
+    def parameters(self, A1: float) -> dict[str, float]:
+        """Named rate parameters, one entry per distinct rate name."""
+        return dict(zip(self.rate_names, self.rates(A1).tolist()))
+
+    def reactant_counts(self, reaction: int) -> dict[str, int]:
+        return _counts(self.species, self.reactants[reaction])
+
+    def product_counts(self, reaction: int) -> dict[str, int]:
+        return _counts(self.species, self.products[reaction])
+
+
+def rate_vectors(table: RateTable, source: np.ndarray):
+    """``rate_constant`` and ``rate_ligand`` of reactions with ``rate_source``."""
+    kind, ligand, copy, receptor = source.T
+    value = np.select(
+        [kind == BIND, kind == ON, kind == OFF],
+        [
+            table.bind[ligand, receptor],
+            table.on[ligand, copy, receptor] * table.stoch * table.boost_up,
+            table.off[ligand, copy, receptor],
+        ],
+        table.endocytosis[ligand],
+    )
+    bind = kind == BIND
+    constant, ligand_part = np.where(bind, 0.0, value), np.where(bind, value, 0.0)
+    for array in (constant, ligand_part):
+        array.flags.writeable = False
+    return constant, ligand_part
+
+
+def _counts(species: tuple[str, ...], indices: np.ndarray) -> dict[str, int]:
+    return {species[i]: n for i, n in Counter(indices[indices >= 0].tolist()).items()}
+
+
+def complexes(receptors: tuple[str, ...] = RECEPTORS) -> list[tuple[str, ...]]:
+    """All receptor combinations a single ligand can hold, smallest first."""
+    result = []
+    for size in range(1, sum(MAX_PER_TYPE.values()) + 1):
+        for combo in itertools.combinations_with_replacement(receptors, size):
+            per_type = Counter(RECEPTOR_TYPES[r] for r in combo)
+            if all(per_type[t] <= n for t, n in MAX_PER_TYPE.items()):
+                result.append(combo)
+    return result
+
+
+def complex_name(ligand: str, combo: tuple[str, ...]) -> str:
+    return "_".join((ligand,) + combo)
+
+
+def assembly_rules(receptors: tuple[str, ...] = RECEPTORS):
+    """``(complex, receptor, copy)`` for every reversible assembly step.
+
+    The empty complex stands for the free ligand binding its first receptor;
+    ``copy`` is 0 or 1 for the first or second receptor of that kind.
+    """
+    valid = set(complexes(receptors))
+    for combo in [()] + complexes(receptors):
+        for receptor in receptors:
+            grown = tuple(sorted(combo + (receptor,), key=receptors.index))
+            if grown in valid:
+                yield combo, receptor, combo.count(receptor)
+
+
+@lru_cache(maxsize=None)
+def build_network(
+    ligands: tuple[str, ...] = LIGANDS,
+    receptors: tuple[str, ...] = RECEPTORS,
+    boost_up: float = BOOST_UP,
+) -> Network:
+    """Generate the mass-action network for the given ligands and receptors."""
+    combos = complexes(receptors)
+    rules = list(assembly_rules(receptors))
+    if receptors == RECEPTORS:
+        rules.sort(key=lambda rule: TABLE_STEPS.index(rule[:2]))
+    species = list(receptors)
+    species_ligand = [-1] * len(receptors)
+    composition = [[int(r == s) for s in receptors] for r in receptors]
+    for li, ligand in enumerate(ligands):
+        species.extend(complex_name(ligand, c) for c in combos)
+        species_ligand.extend([li] * len(combos))
+        composition.extend([c.count(s) for s in receptors] for c in combos)
+    index = {name: i for i, name in enumerate(species)}
+
+    names, rate_names, reactants, products, sources = [], [], [], [], []
+
+    def add(name, rate_name, lhs, rhs, source):
+        names.append(name)
+        rate_names.append(rate_name)
+        reactants.append([index[s] for s in lhs])
+        products.append([index[s] for s in rhs])
+        sources.append(source)
+
+    table = DEFAULT_RATES.override(boost_up=boost_up)
+    for li, ligand in enumerate(ligands):
+        t = table.ligands.index(ligand)
+        for j, (combo, receptor, copy) in enumerate(rules):
+            n = li * len(rules) + j + 1
+            r = RECEPTORS.index(receptor)
+            bound = [complex_name(ligand, combo)] if combo else []
+            grown = tuple(sorted(combo + (receptor,), key=receptors.index))
+            product = complex_name(ligand, grown)
+            suffix = "" if combo or (combo, receptor) in UNSUFFIXED_STEPS else "A"
+            add(
+                f"{product} production {2 * j + 1}",
+                f"k{n}{suffix}",
+                bound + [receptor],
+                [product],
+                (ON if combo else BIND, t, copy, r),
+            )
+            add(
+                f"{product} dissolution {2 * j + 2}",
+                f"k{n}r",
+                [product],
+                bound + [receptor],
+                (OFF, t, copy, r),
+            )
+        for i, combo in enumerate(combos):
+            add(
+                f"endo{table.tags[t]}{i + 1}",
+                table.endocytosis_parameters[t],
+                [complex_name(ligand, combo)],
+                list(combo),
+                (ENDOCYTOSIS, t, 0, 0),
+            )
+
+    def padded(rows, width):
+        out = np.full((len(rows), width), -1, dtype=np.int32)
+        for i, row in enumerate(rows):
+            out[i, : len(row)] = row
+        return out
+
+    stoichiometry = np.zeros((len(names), len(species)), dtype=np.int32)
+    for i, (lhs, rhs) in enumerate(zip(reactants, products)):
+        np.add.at(stoichiometry[i], rhs, 1)
+        np.add.at(stoichiometry[i], lhs, -1)
+    reactants = padded(reactants, 2)
+    products = padded(products, max(map(len, products)))
+    rate_source = np.array(sources, dtype=np.int64)
+    rate_constant, rate_ligand = rate_vectors(table, rate_source)
+
+    network = Network(
+        species=tuple(species),
+        receptors=tuple(receptors),
+        ligands=tuple(ligands),
+        species_ligand=np.array(species_ligand),
+        composition=np.array(composition),
+        reaction_names=tuple(names),
+        rate_names=tuple(rate_names),
+        reactants=reactants,
+        products=products,
+        stoichiometry=stoichiometry,
+        rate_source=rate_source,
+        rate_constant=rate_constant,
+        rate_ligand=rate_ligand,
+    )
+    # the network is shared through the cache, so keep its arrays read-only
+    for array in (reactants, products, stoichiometry, rate_source):
+        array.flags.writeable = False
+    network.species_ligand.flags.writeable = False
+    network.composition.flags.writeable = False
+    return network
@@ -0,0 +1,199 @@
+"""
+Next Reaction Method (Gibson & Bruck 2000), one cell at a time.
+
+Every reaction keeps an absolute putative firing time in an indexed binary
+heap, so the next event is the root and any reaction's time can be changed
+in ``O(log R)``. After an event only the reactions in its dependency graph
+entry, those with a reactant whose count changed, get a new propensity;
+their firing times are rescaled instead of redrawn, so one random number is
+used per event. In this network an event touches about 40 of the 231
+channels, mostly through the free receptor counts.
+"""
+
+import math
+from functools import partial
+from time import perf_counter
+
+import numpy as np
+
+from batch_ssa import output_array
+from network import Network, Observables, build_network
+
+
+def dependency_graph(network: Network) -> list[list[int]]:
+    """Reactions whose propensity changes when each reaction fires."""
+    changes = network.stoichiometry != 0
+    reactants = network.reactants
+    graph = []
+    for changed in changes:
+        uses = (changed[reactants] & (reactants >= 0)).any(axis=1)
+        graph.append(np.flatnonzero(uses).tolist())
+    return graph
+
+
+class IndexedHeap:
+    """Binary min-heap of reaction times that can update any reaction in place."""
+
+    def __init__(self, times: list[float]):
+        self.times = list(times)
+        self.heap = sorted(range(len(times)), key=self.times.__getitem__)
+        self.position = [0] * len(times)
+        for i, reaction in enumerate(self.heap):
+            self.position[reaction] = i
+
+    def top(self) -> tuple[int, float]:
+        reaction = self.heap[0]
+        return reaction, self.times[reaction]
+
+    def update(self, reaction: int, time: float) -> None:
+        old = self.times[reaction]
+        self.times[reaction] = time
+        if time < old:
+            self._up(self.position[reaction])
+        elif time > old:
+            self._down(self.position[reaction])
+
+    def _swap(self, i: int, j: int) -> None:
+        heap, position = self.heap, self.position
+        heap[i], heap[j] = heap[j], heap[i]
+        position[heap[i]] = i
+        position[heap[j]] = j
+
+    def _up(self, i: int) -> None:
+        heap, times = self.heap, self.times
+        while i:
+            parent = (i - 1) // 2
+            if times[heap[parent]] <= times[heap[i]]:
+                return
+            self._swap(i, parent)
+            i = parent
+
+    def _down(self, i: int) -> None:
+        heap, times, n = self.heap, self.times, len(self.heap)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                return
+            if child + 1 < n and times[heap[child + 1]] < times[heap[child]]:
+                child += 1
+            if times[heap[i]] <= times[heap[child]]:
+                return
+            self._swap(i, child)
+            i = child
+
+
+def _simulate_cell(
+    network, graph, changes, rates, state, timespan, rng, record, profile=None
+):
+    """Run one cell from ``state``; ``record(k, counts)`` stores sample ``k``.
+
+    Returns the counts at the last sample time. A ``profile`` gets every
+    event with the wall time spent on it.
+    """
+    first, second = network.reactants.T.tolist()
+    x = state.tolist() + [1]  # the padded reactant index -1 reads this 1
+    rates = rates.tolist()
+
+    def propensity(k: int) -> float:
+        return rates[k] * x[first[k]] * x[second[k]]
+
+    a = [propensity(k) for k in range(len(rates))]
+    heap = IndexedHeap([rng.exponential() / ak if ak > 0 else math.inf for ak in a])
+    sample, n_samples = 0, len(timespan)
+    last = 0.0
+    while sample < n_samples:
+        mu, t = heap.top()
+        while sample < n_samples and timespan[sample] < t:
+            record(sample, x[:-1])
+            sample += 1
+        if sample == n_samples:
+            break
+        if profile is not None:
+            held = np.array([a])
+            tick = perf_counter()
+        for s, change in changes[mu]:
+            x[s] += change
+        for k in graph[mu]:
+            old, new = a[k], propensity(k)
+            a[k] = new
+            if k == mu or old == 0.0:
+                due = t + rng.exponential() / new if new > 0 else math.inf
+            elif new > 0:
+                due = t + old / new * (heap.times[k] - t)
+            else:
+                due = math.inf
+            heap.update(k, due)
+        if mu not in graph[mu]:
+            heap.update(mu, t + rng.exponential() / a[mu] if a[mu] > 0 else math.inf)
+        if profile is not None:
+            seconds = perf_counter() - tick
+            profile.record(np.array([mu]), held, np.array([t - last]), seconds)
+            last = t
+    if profile is not None:
+        profile.record(
+            np.array([-1]), np.array([a]), np.array([timespan[-1] - last]), 0
+        )
+    return x[:-1]
+
+
+def run_cells(
+    simulate_cell,
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+) -> np.ndarray:
+    """Run a single-cell engine over every cell with ``batch_ssa.simulate``'s arrays.
+
+    ``simulate_cell(network, graph, changes, rates, state, timespan, rng,
+    record)`` gets the dependency graph, the ``(species, change)`` pairs of
+    every reaction and the cell's rates, and returns its last sampled state.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    n_cells, n_species = len(A1), network.n_species
+    rates = network.rates(A1)
+    init = np.broadcast_to(init, (n_cells, n_species)).astype(np.int64)
+    graph = dependency_graph(network)
+    changes = [
+        [(s, int(row[s])) for s in np.flatnonzero(row)] for row in network.stoichiometry
+    ]
+    rng = np.random.default_rng(seed)
+
+    out = output_array(n_cells, timespan, network, observables)
+    for cell in range(n_cells):
+
+        def record(k, counts, cell=cell):
+            counts = np.asarray(counts)
+            out[cell, k] = counts if observables is None else observables(counts)
+
+        last = simulate_cell(
+            network, graph, changes, rates[cell], init[cell], timespan, rng, record
+        )
+        if final is not None:
+            final[cell] = last
+    return out
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+    profile=None,
+) -> np.ndarray:
+    """Exact SSA trajectories of many cells, sampled at ``timespan``.
+
+    Takes and returns the same arrays as ``batch_ssa.simulate`` and fills a
+    ``profiling.ReactionProfile`` passed as ``profile`` the same way.
+    """
+    simulate_cell = partial(_simulate_cell, profile=profile)
+    return run_cells(
+        simulate_cell, A1, init, timespan, seed, network, observables, final
+    )
@@ -0,0 +1,141 @@
+"""
+Which reactions spend the event budget.
+
+``ReactionProfile`` is filled by ``batch_ssa.simulate`` or
+``next_reaction.simulate`` with ``profile=...`` and counts, for every
+reaction channel, how often it fired, its propensity integrated over time
+(the expected number of firings, whose share says how much of the total
+event rate it draws) and the wall time spent on its events. The batched
+engine fires one event per cell in each vectorized step, so it can only
+split a step's time evenly over those events and a channel's seconds
+follow its firing count. The Next Reaction Method times every event, whose
+cost grows with the channels its dependency graph entry updates, so
+``--solver nrm`` shows what each channel actually costs. Species update
+counts follow from the firings and the stoichiometry. Fast reversible
+pairs that dominate the firings while barely changing the state are the
+candidates to lump, leap or treat as equilibria.
+
+    python profiling.py --A1 0.05 --cells 36 --decay 8 --time 100
+    python profiling.py --A1 0.05 --solver nrm
+"""
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+import batch_ssa
+import next_reaction
+from network import RECEPTOR_LEVELS, Network, build_network
+from sweep import exponential_gradient
+
+# the engines that can fill a ``ReactionProfile``
+PROFILED = {"batch": batch_ssa.simulate, "nrm": next_reaction.simulate}
+
+
+@dataclass
+class ReactionProfile:
+    network: Network
+    firings: np.ndarray
+    propensity: np.ndarray
+    seconds: np.ndarray
+    simulated: float = 0.0
+
+    @classmethod
+    def empty(cls, network: Network | None = None) -> "ReactionProfile":
+        network = network or build_network()
+        n = network.n_reactions
+        return cls(network, np.zeros(n, dtype=np.int64), np.zeros(n), np.zeros(n))
+
+    def record(self, reaction, a, step, seconds: float) -> None:
+        """Add one step of every cell.
+
+        ``reaction`` is the reaction each cell fired (-1 for none), ``a`` the
+        propensities (``(cells, R)``) it held for ``step``, and ``seconds``
+        the wall time of the step, shared evenly by the events it fired.
+        """
+        self.propensity += step @ a
+        self.simulated += float(step.sum())
+        fired = reaction[reaction >= 0]
+        counts = np.bincount(fired, minlength=self.network.n_reactions)
+        self.firings += counts
+        if len(fired):
+            self.seconds += counts * (seconds / len(fired))
+
+    @property
+    def species_updates(self) -> np.ndarray:
+        """Number of events that changed each species."""
+        return self.firings @ (self.network.stoichiometry != 0)
+
+    def reactions(self) -> pd.DataFrame:
+        """Per-reaction counters, most frequent first."""
+        network = self.network
+        total = max(self.propensity.sum(), np.finfo(float).tiny)
+        return pd.DataFrame(
+            {
+                "rate": network.rate_names,
+                "firings": self.firings,
+                "firing_share": self.firings / max(self.firings.sum(), 1),
+                "propensity_share": self.propensity / total,
+                "seconds": self.seconds,
+                "us_per_firing": 1e6 * self.seconds / np.maximum(self.firings, 1),
+            },
+            index=pd.Index(network.reaction_names, name="reaction"),
+        ).sort_values("firings", ascending=False)
+
+    def species(self) -> pd.DataFrame:
+        """Update counts of each species and their rate per cell and time unit."""
+        updates = self.species_updates
+        return pd.DataFrame(
+            {
+                "updates": updates,
+                "per_time": updates / self.simulated if self.simulated else np.nan,
+            },
+            index=pd.Index(self.network.species, name="species"),
+        ).sort_values("updates", ascending=False)
+
+
+def profile_reactions(
+    A1,
+    init: np.ndarray | None = None,
+    timespan: np.ndarray = np.linspace(1.0, 100.0, 100),
+    seed: int | np.random.Generator | None = None,
+    solver: str = "batch",
+) -> ReactionProfile:
+    """Profile an exact SSA run of cells at ``A1`` from ``init`` (free receptors).
+
+    ``solver`` is ``"batch"`` or ``"nrm"``, see the module docstring.
+    """
+    network = build_network()
+    if init is None:
+        init = network.free_state(RECEPTOR_LEVELS)
+    profile = ReactionProfile.empty(network)
+    PROFILED[solver](A1, init, timespan, seed, network, profile=profile)
+    return profile
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--A1", type=float, default=0.05)
+    parser.add_argument("--cells", type=int, default=1)
+    parser.add_argument("--decay", type=float, default=np.inf)
+    parser.add_argument("--time", type=float, default=100.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--solver", choices=PROFILED, default="batch")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    A1 = args.A1 * np.asarray(exponential_gradient(args.cells, args.decay))
+    timespan = np.linspace(args.time / 100, args.time, 100)
+    profile = profile_reactions(
+        A1, timespan=timespan, seed=args.seed, solver=args.solver
+    )
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(profile.reactions().head(args.top))
+        print(f"{profile.firings.sum()} events in {profile.seconds.sum():.2f} s")
+        print(profile.species().head(args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Content-addressed cache of simulated chunks with a size-bounded LRU.
+
+A chunk is fully determined by the network (topology and rates), its
+``ParameterValues`` (ligand, initial state, timespan, solver, observables)
+and an integer seed, so their hash names the stored result. Hits refresh
+the file's modification time; after every store the least recently used
+entries are removed until the cache fits in ``MAX_BYTES``. Runs without a
+fixed integer seed, or driven by an arbitrary ``FromFunction`` schedule that
+cannot be hashed by content, are never cached.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+from model import ParameterValues, initial_state
+from schedule import FromFunction
+from simulation import check_seed, run_chunk
+from solver_cache import CACHE_DIR, model_key
+
+RESULTS_DIR = CACHE_DIR / "results"
+MAX_BYTES = int(os.environ.get("BMP_RESULT_CACHE_BYTES", 2 * 1024**3))
+# part of every key; bump it when a change to the engines alters their results
+VERSION = 2
+
+
+def result_key(parameter_values: ParameterValues, seed: int) -> str:
+    """Hash of everything that determines the result of ``run_chunk``."""
+    digest = hashlib.sha256(f"{VERSION}:".encode())
+    digest.update(model_key(parameter_values.network()).encode())
+    digest.update(parameter_values.solver.encode())
+    digest.update(str(int(seed)).encode())
+    for array in (
+        np.asarray(parameter_values.timespan, dtype=float),
+        np.asarray(initial_state(parameter_values.init)),
+    ):
+        digest.update(array.dtype.str.encode() + array.tobytes())
+    # floats and the frozen schedule dataclasses repr exactly
+    digest.update(repr(parameter_values.A1).encode())
+    observables = parameter_values.observables
+    if observables is not None:
+        digest.update("\0".join(observables.names).encode())
+        digest.update(observables.weights.tobytes())
+    return digest.hexdigest()[:32]
+
+
+def _evict(directory: Path, max_bytes: int) -> None:
+    entries = []
+    for path in directory.glob("*.npz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # removed by another worker
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_run_chunk(
+    parameter_values: ParameterValues,
+    seed: int | np.random.Generator | None,
+    directory: Path = RESULTS_DIR,
+    max_bytes: int = MAX_BYTES,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``run_chunk`` that reuses a stored result for the same inputs."""
+    check_seed(seed)
+    if not isinstance(seed, (int, np.integer)) or isinstance(
+        parameter_values.A1, FromFunction
+    ):
+        return run_chunk(parameter_values, seed)
+    path = Path(directory) / f"{result_key(parameter_values, seed)}.npz"
+    try:
+        with np.load(path) as data:
+            result = data["time"], data["recorded"], data["final"]
+        os.utime(path)
+        return result
+    except FileNotFoundError:
+        pass
+
+    time, recorded, final = run_chunk(parameter_values, seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez(partial, time=time, recorded=recorded, final=final)
+    os.replace(partial, path)
+    _evict(path.parent, max_bytes)
+    return time, recorded, final
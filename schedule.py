@@ -0,0 +1,87 @@
+"""
+Ligand concentrations that change during a simulation (Figure 5).
+
+A schedule gives ``A1`` as a function of time within a chunk. The engines
+apply it as a sequence of constant-``A1`` segments inside one trajectory:
+``segments`` splits a time interval at the schedule's own breakpoints, which
+is exact for piecewise-constant schedules, and every ``resolution`` time
+units for ramps and arbitrary functions, which then use the value at the
+middle of each segment.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+
+class Schedule(ABC):
+    """Base class; subclasses define ``__call__`` and ``breakpoints``."""
+
+    @abstractmethod
+    def __call__(self, t):
+        """``A1`` at the times ``t``."""
+
+    @abstractmethod
+    def breakpoints(self, start: float, end: float) -> np.ndarray:
+        """Times strictly inside ``(start, end)`` where ``A1`` is updated."""
+
+    def segments(self, start: float, end: float) -> list[tuple[float, float, float]]:
+        """``(segment start, segment end, A1)`` covering ``[start, end]``."""
+        bounds = np.concatenate([[start], self.breakpoints(start, end), [end]])
+        values = np.broadcast_to(self((bounds[:-1] + bounds[1:]) / 2), bounds[1:].shape)
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist(), values.tolist()))
+
+
+def _grid(start: float, end: float, resolution: float) -> np.ndarray:
+    return np.arange(start + resolution, end, resolution)
+
+
+@dataclass(frozen=True)
+class PiecewiseConstant(Schedule):
+    """``values[i]`` from ``times[i]`` on; ``values[0]`` before ``times[0]``."""
+
+    times: tuple[float, ...]
+    values: tuple[float, ...]
+
+    def __call__(self, t):
+        index = np.searchsorted(self.times, t, side="right") - 1
+        return np.asarray(self.values)[np.maximum(index, 0)]
+
+    def breakpoints(self, start: float, end: float) -> np.ndarray:
+        times = np.asarray(self.times, dtype=float)
+        return times[(times > start) & (times < end)]
+
+
+@dataclass(frozen=True)
+class LinearRamp(Schedule):
+    """``A1`` from ``initial`` at ``start`` to ``final`` at ``end``, flat outside."""
+
+    initial: float
+    final: float
+    start: float
+    end: float
+    resolution: float = 1.0
+
+    def __call__(self, t):
+        return np.interp(t, (self.start, self.end), (self.initial, self.final))
+
+    def breakpoints(self, start: float, end: float) -> np.ndarray:
+        grid = _grid(self.start, self.end, self.resolution)
+        times = np.concatenate([[self.start], grid, [self.end]])
+        return times[(times > start) & (times < end)]
+
+
+@dataclass(frozen=True)
+class FromFunction(Schedule):
+    """Any ``A1(t)``, updated every ``resolution`` time units."""
+
+    function: Callable[[np.ndarray], np.ndarray]
+    resolution: float = 1.0
+
+    def __call__(self, t):
+        return self.function(t)
+
+    def breakpoints(self, start: float, end: float) -> np.ndarray:
+        return _grid(start, end, self.resolution)
@@ -0,0 +1,167 @@
+"""
+Single-cell entry point that dispatches on ``ParameterValues.solver``.
+
+``"ssa"`` runs the compiled gillespy2 solver, the other names run one of the
+NumPy/SciPy engines (``"ode"`` is the deterministic model). Every solver
+starts from ``init`` at time 0 and returns one row per ``timespan`` entry;
+the compiled solver's extra row at time 0 is dropped unless ``timespan``
+asks for it. ``run`` returns the ``Results.to_array()`` layout, ``(1,
+timepoints, 1 + species)`` with time first and species in alphabetical
+order. ``run_chunk`` returns the recorded columns in network order together
+with the full final state, which is what chunked runs write out and
+checkpoint.
+"""
+
+from dataclasses import replace
+from importlib.util import find_spec
+
+import numpy as np
+
+import batch_ssa
+import composition_rejection
+import hybrid
+import next_reaction
+import ode
+import tau_leaping
+from model import ParameterValues, initial_state
+from network import build_network
+from schedule import Schedule
+from solver_cache import run_model
+
+
+def _jit_simulate(*args, **kwargs):
+    # imported on first use, loading numba takes about a second
+    import jit_ssa
+
+    return jit_ssa.simulate(*args, **kwargs)
+
+
+ENGINES = {
+    "batch": batch_ssa.simulate,
+    "tau": tau_leaping.simulate,
+    "hybrid": hybrid.simulate,
+    "nrm": next_reaction.simulate,
+    "cr": composition_rejection.simulate,
+    "ode": lambda A1, init, timespan, seed=None, **record: ode.simulate(
+        A1, init, timespan, **record
+    ),
+}
+if find_spec("numba") is not None:  # numba is optional
+    ENGINES["jit"] = _jit_simulate
+SOLVERS = ("ssa",) + tuple(ENGINES)
+# gillespy2 rejects seeds below 1 and its C solver only reads 31 bits, so
+# larger seeds all give the same run
+SEED_LIMIT = 2**31 - 1
+
+
+def check_seed(seed) -> None:
+    """Reject integer seeds outside the range the compiled solver can use."""
+    if isinstance(seed, (int, np.integer)) and not 1 <= seed < SEED_LIMIT:
+        raise ValueError(f"integer seeds must be in [1, {SEED_LIMIT}), got {seed}")
+
+
+def run_chunk(
+    parameter_values: ParameterValues,
+    seed: int | np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate one cell; returns sample times, recorded values and last state.
+
+    The recorded values are the declared observables, or all species in
+    network order, shape ``(timepoints, columns)``. The last state always has
+    every species so the next chunk can start from it. A generator is
+    advanced in place, so passing the same one to consecutive chunks
+    continues a single random stream. Integer seeds must be positive and
+    below ``SEED_LIMIT``.
+    """
+    check_seed(seed)
+    if isinstance(parameter_values.A1, Schedule):
+        return _run_schedule(parameter_values, seed)
+    observables = parameter_values.observables
+    if parameter_values.solver == "ssa":
+        if isinstance(seed, np.random.Generator):
+            seed = int(seed.integers(1, SEED_LIMIT))
+        # gillespy2 samples from 0, which ``timespan`` need not include
+        results = run_model(parameter_values, seed=seed).to_array()[0]
+        results = results[-len(parameter_values.timespan) :]
+        counts = np.empty((len(results), results.shape[1] - 1), dtype=np.int64)
+        counts[:, np.argsort(build_network().species)] = np.rint(results[:, 1:])
+        recorded = counts if observables is None else observables(counts)
+        return results[:, 0], recorded, counts[-1]
+    if parameter_values.solver not in ENGINES:
+        raise ValueError(
+            f"unknown solver {parameter_values.solver!r}, expected one of {SOLVERS}"
+        )
+    timespan = np.asarray(parameter_values.timespan, dtype=float)
+    init = initial_state(parameter_values.init)
+    final = np.empty(
+        (1, len(init)), dtype=float if parameter_values.solver == "ode" else np.int64
+    )
+    recorded = ENGINES[parameter_values.solver](
+        [parameter_values.A1],
+        init,
+        timespan,
+        seed=seed,
+        network=parameter_values.network(),
+        observables=observables,
+        final=final,
+    )
+    return timespan, recorded[0], final[0]
+
+
+def _segments(parameter_values: ParameterValues, timespan: np.ndarray):
+    """Constant-``A1`` segments of a scheduled chunk.
+
+    The compiled solver only samples on a uniform grid from 0, so for
+    ``"ssa"`` segments are whole sample intervals, merged where the value at
+    their midpoint does not change.
+    """
+    schedule = parameter_values.A1
+    if parameter_values.solver != "ssa":
+        return schedule.segments(0.0, timespan[-1])
+    grid = timespan if timespan[0] == 0 else np.concatenate([[0.0], timespan])
+    values = np.broadcast_to(schedule((grid[:-1] + grid[1:]) / 2), (len(grid) - 1,))
+    edges = np.concatenate([[0], np.flatnonzero(np.diff(values)) + 1, [len(values)]])
+    return [(grid[i], grid[j], values[i]) for i, j in zip(edges[:-1], edges[1:])]
+
+
+def _run_schedule(
+    parameter_values: ParameterValues, seed: int | np.random.Generator | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``run_chunk`` for a ligand schedule, one constant-``A1`` run per segment.
+
+    Each segment continues from the exact state where the previous one
+    ended, so the result is one trajectory sampled at ``timespan``.
+    """
+    timespan = np.asarray(parameter_values.timespan, dtype=float)
+    rng = np.random.default_rng(seed)
+    state = initial_state(parameter_values.init)
+    recorded = []
+    for start, end, A1 in _segments(parameter_values, timespan):
+        # a sample at 0 belongs to the first segment, every other to its end
+        after = timespan >= start if not recorded else timespan > start
+        inside = timespan[after & (timespan <= end)]
+        # also sample the segment's end, where the next one starts from
+        local = inside if len(inside) and inside[-1] == end else np.append(inside, end)
+        # gillespy2 needs at least two samples from 0, so start there and
+        # drop that row unless it is one of the requested samples
+        skip = 0 if local[0] == start else 1
+        local = np.concatenate([[start], local])[1 - skip :]
+        segment = replace(parameter_values, A1=A1, timespan=local - start, init=state)
+        _, values, state = run_chunk(segment, rng)
+        recorded.append(values[skip : skip + len(inside)])
+    return timespan, np.concatenate(recorded), state
+
+
+def run(
+    parameter_values: ParameterValues,
+    seed: int | np.random.Generator | None = None,
+) -> np.ndarray:
+    """Simulate one cell with the solver named in ``parameter_values``.
+
+    Returns the ``to_array()`` layout, with the observables in declared order
+    instead of the species when ``parameter_values`` declares any.
+    """
+    time, recorded, _ = run_chunk(parameter_values, seed)
+    if parameter_values.observables is None:
+        recorded = recorded[:, np.argsort(build_network().species)]
+    return np.concatenate([time[:, None], recorded], axis=-1)[None]
@@ -0,0 +1,90 @@
+"""
+Compile the C++ SSA solver once per network topology and reuse it.
+
+gillespy2 bakes rate constants and initial counts into the generated C++ and
+recompiles for every new model. Built with ``variable=True`` the executable
+instead takes both as command line inputs, so one build serves every A1 value
+and every initial state of the same network. Executables are kept under
+``CACHE_DIR`` keyed by a hash of the topology, so later processes skip the
+compiler entirely.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+import gillespy2
+from gillespy2 import SSACSolver
+from gillespy2.core.results import Results
+
+from model import ParameterValues, SomeModel, initial_state
+from network import Network, build_network
+
+CACHE_DIR = Path(
+    os.environ.get("BMP_CACHE_DIR", Path.home() / ".cache" / "bmp_receptor")
+)
+
+_solvers: dict[str, "CachedSSACSolver"] = {}
+
+
+def topology_key(network: Network) -> str:
+    """Hash of everything compiled into the solver besides runtime inputs."""
+    digest = hashlib.sha256()
+    digest.update(gillespy2.__version__.encode())
+    for names in (network.species, network.reaction_names, network.rate_names):
+        digest.update("\0".join(names).encode())
+    digest.update(network.reactants.tobytes())
+    digest.update(network.products.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def model_key(network: Network) -> str:
+    """Hash of the topology and every rate, i.e. everything that shapes results."""
+    digest = hashlib.sha256(topology_key(network).encode())
+    digest.update(network.rate_constant.tobytes())
+    digest.update(network.rate_ligand.tobytes())
+    return digest.hexdigest()[:16]
+
+
+class CachedSSACSolver(SSACSolver):
+    """SSACSolver that reuses an executable from ``CACHE_DIR`` when present."""
+
+    def __init__(self, model: gillespy2.Model, key: str):
+        self.executable = CACHE_DIR / "ssa" / key / "simulation"
+        super().__init__(model=model, variable=True)
+
+    # a private gillespy2 hook, hence the upper bound in requirements.txt
+    def _build(self, model, simulation_name, variable, debug=False) -> str:
+        if not self.executable.exists():
+            built = super()._build(model, simulation_name, variable, debug)
+            self.executable.parent.mkdir(parents=True, exist_ok=True)
+            # copy then rename so concurrent workers never see a partial file
+            partial = self.executable.with_suffix(f".{os.getpid()}")
+            shutil.copy2(built, partial)
+            os.replace(partial, self.executable)
+        return str(self.executable)
+
+
+def compiled_solver(parameter_values: ParameterValues) -> CachedSSACSolver:
+    """Solver for the default network, built on first use in this process."""
+    key = topology_key(build_network())
+    if key not in _solvers:
+        _solvers[key] = CachedSSACSolver(SomeModel(parameter_values), key)
+    return _solvers[key]
+
+
+def runtime_variables(parameter_values: ParameterValues) -> dict[str, float]:
+    """Rate parameters and initial counts passed to the compiled solver."""
+    network = parameter_values.network()
+    init = initial_state(parameter_values.init)
+    variables = network.parameters(parameter_values.A1)
+    variables.update(zip(network.species, map(int, init)))
+    return variables
+
+
+def run_model(parameter_values: ParameterValues, seed: int | None = None) -> Results:
+    """Simulate ``SomeModel(parameter_values)`` without recompiling."""
+    solver = compiled_solver(parameter_values)
+    solver.model.timespan(parameter_values.timespan)
+    return solver.run(variables=runtime_variables(parameter_values), seed=seed)
@@ -0,0 +1,139 @@
+"""
+Running ensemble moments that never hold the samples themselves.
+
+``Moments`` keeps a count, mean and sum of squared deviations per group
+(e.g. a cell of the gradient), time bin and observable. Batches of samples
+are folded in with the pairwise update of Chan et al., the batched form of
+Welford's algorithm, and accumulators filled by different workers merge the
+same way. Memory is ``groups x time bins x observables`` whatever the size
+of the ensemble; mean, SD and CV bands (Figure 2c/2f) come straight out.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+@dataclass
+class Moments:
+    names: tuple[str, ...]
+    time_edges: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def empty(cls, names, groups: int, time_edges) -> "Moments":
+        time_edges = np.asarray(time_edges, dtype=float)
+        shape = (groups, len(time_edges) - 1)
+        return cls(
+            tuple(names),
+            time_edges,
+            np.zeros(shape, dtype=np.int64),
+            np.zeros(shape + (len(names),)),
+            np.zeros(shape + (len(names),)),
+        )
+
+    def _combine(self, count, mean, m2) -> None:
+        total = self.count + count
+        safe = np.maximum(total, 1)[..., None]
+        delta = mean - self.mean
+        self.m2 += m2 + delta**2 * (self.count * count)[..., None] / safe
+        self.mean += delta * count[..., None] / safe
+        self.count[...] = total
+
+    def update(self, group, time: np.ndarray, values: np.ndarray) -> None:
+        """Add samples ``values`` (``(timepoints, observables)``) taken at ``time``.
+
+        ``group`` is one group index or one per sample. Bins include their
+        left edge, and the last one its right edge as well; samples outside
+        the time edges are ignored.
+        """
+        groups, bins = self.count.shape
+        time_bin = np.searchsorted(self.time_edges, time, side="right") - 1
+        time_bin[np.asarray(time) == self.time_edges[-1]] = bins - 1
+        inside = (time_bin >= 0) & (time_bin < bins)
+        group = np.broadcast_to(group, time_bin.shape)[inside]
+        values = np.asarray(values, dtype=float)[inside]
+        cell = group * bins + time_bin[inside]
+
+        n = groups * bins
+        count = np.bincount(cell, minlength=n)
+        sums = np.stack([np.bincount(cell, v, n) for v in values.T], axis=-1)
+        mean = sums / np.maximum(count, 1)[:, None]
+        squares = (values - mean[cell]) ** 2
+        m2 = np.stack([np.bincount(cell, v, n) for v in squares.T], axis=-1)
+        shape = self.mean.shape
+        self._combine(
+            count.reshape(groups, bins), mean.reshape(shape), m2.reshape(shape)
+        )
+
+    def merge(self, other: "Moments", group: int | None = None) -> "Moments":
+        """Fold in an accumulator with the same time bins and names.
+
+        ``other`` has the same groups, or a single one that is merged into
+        ``group``, e.g. the accumulator of one worker's cell.
+        """
+        target = self if group is None else self[group]
+        if (other.names, other.count.shape) != (target.names, target.count.shape):
+            raise ValueError("cannot merge moments of different layouts")
+        target._combine(other.count, other.mean, other.m2)
+        return self
+
+    def __getitem__(self, group: int) -> "Moments":
+        """View of one group; updating it updates this accumulator."""
+        part = slice(group, group + 1)
+        return Moments(
+            self.names,
+            self.time_edges,
+            self.count[part],
+            self.mean[part],
+            self.m2[part],
+        )
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Sample variance, NaN where a bin has fewer than two samples."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.count[..., None] > 1,
+                self.m2 / (self.count[..., None] - 1),
+                np.nan,
+            )
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+    @property
+    def cv(self) -> np.ndarray:
+        """Coefficient of variation, SD over mean."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.std / self.mean
+
+    def save(self, path: str | Path) -> None:
+        """Write the accumulator, replacing ``path`` atomically."""
+        path = Path(path)
+        partial = path.with_suffix(f".{os.getpid()}.npz")
+        np.savez(
+            partial,
+            names=np.array(self.names),
+            time_edges=self.time_edges,
+            count=self.count,
+            mean=self.mean,
+            m2=self.m2,
+        )
+        os.replace(partial, path)
+
+
+def load(path: str | Path) -> Moments:
+    with np.load(path) as data:
+        return Moments(
+            tuple(data["names"]),
+            data["time_edges"],
+            data["count"],
+            data["mean"],
+            data["m2"],
+        )
@@ -0,0 +1,126 @@
+"""
+Mass-action steady states, dose-response curves and EC50 values.
+
+Every reaction conserves the total of each receptor type, so the steady state
+for given receptor totals is the root of the mass-action right-hand side with
+one equation per receptor replaced by its conservation law. It is found by
+Newton iteration on log counts, warm-started from the previous A1 value while
+walking up a sorted concentration grid.
+"""
+
+import numpy as np
+
+from network import RECEPTOR_LEVELS, Network, build_network
+from ode import Jacobian, deterministic_propensities, right_hand_side, simulate
+
+# time to integrate towards steady state when Newton needs a better start
+SETTLE_TIME = 1e7
+# largest change in any log count per Newton step
+MAX_LOG_STEP = 2.0
+# floor for counts of species that are absent from the starting state
+TINY = 1e-12
+
+
+def _newton(
+    network: Network,
+    rates: np.ndarray,
+    totals: np.ndarray,
+    x: np.ndarray,
+    tol: float,
+    max_iter: int,
+) -> np.ndarray | None:
+    """Newton iteration on log counts from ``x``; None if it does not converge.
+
+    Working in ``log x`` keeps every count positive, and each step is capped
+    at ``MAX_LOG_STEP`` so a poor start cannot overshoot by many decades.
+    """
+    conserved = [network.species_index(r) for r in network.receptors]
+    jacobian = Jacobian(network, rates[None])
+    u = np.log(np.maximum(x, TINY))
+    for _ in range(max_iter):
+        x = np.exp(u)
+        residual = right_hand_side(network, rates[None], x[None])[0]
+        residual[conserved] = x @ network.composition - totals
+        # residuals relative to the total flux through each species
+        scale = np.abs(network.stoichiometry).T @ (
+            deterministic_propensities(network, rates[None], x[None])[0]
+        )
+        scale[conserved] = totals
+        if np.all(np.abs(residual) <= tol * (scale + TINY)):
+            return x
+        matrix = jacobian(x[None]).toarray()
+        matrix[conserved] = network.composition.T
+        step = np.linalg.solve(matrix * x, -residual)
+        u = u + step * min(1.0, MAX_LOG_STEP / np.abs(step).max())
+    return None
+
+
+def steady_state(
+    A1,
+    totals=RECEPTOR_LEVELS,
+    network: Network | None = None,
+    tol: float = 1e-9,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Steady-state counts for each A1 value, shape ``(len(A1), n_species)``.
+
+    The A1 values are solved in ascending order, each starting from the
+    previous solution; the first starts from the free receptors.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    totals = np.asarray(totals, dtype=float)
+    all_rates = network.rates(A1)
+
+    out = np.empty((len(A1), network.n_species))
+    guess = network.free_state(totals).astype(float)
+    for i in np.argsort(A1):
+        x = _newton(network, all_rates[i], totals, guess, tol, max_iter)
+        if x is None:
+            settled = simulate([A1[i]], guess, np.array([0.0, SETTLE_TIME]), network)
+            x = _newton(network, all_rates[i], totals, settled[0, -1], tol, max_iter)
+        if x is None:
+            raise RuntimeError(f"no steady state found for A1={A1[i]}")
+        out[i] = guess = x
+    return out
+
+
+def dose_response(
+    A1, totals=RECEPTOR_LEVELS, network: Network | None = None
+) -> dict[str, np.ndarray]:
+    """Steady-state tetramer count of each ligand at every A1 value."""
+    network = network or build_network()
+    states = steady_state(A1, totals, network)
+    return {
+        ligand: states[:, network.tetramers(ligand)].sum(axis=1)
+        for ligand in network.ligands
+    }
+
+
+def ec50(A1, response) -> float:
+    """Lowest A1 at which ``response`` reaches half its maximum.
+
+    Interpolates linearly in log(A1) between the bracketing grid points.
+    """
+    A1, response = np.asarray(A1, dtype=float), np.asarray(response, dtype=float)
+    order = np.argsort(A1)
+    A1, response = A1[order], response[order]
+    half = 0.5 * response.max()
+    above = int(np.argmax(response >= half))
+    if above == 0:
+        return float(A1[0])
+    lo, hi = np.log(A1[above - 1 : above + 1])
+    r_lo, r_hi = response[above - 1 : above + 1]
+    return float(np.exp(lo + (half - r_lo) / (r_hi - r_lo) * (hi - lo)))
+
+
+def ec50_curves(
+    A1=np.logspace(-3, 1, 200),
+    totals=RECEPTOR_LEVELS,
+    network: Network | None = None,
+) -> dict[str, tuple[float, np.ndarray]]:
+    """EC50 and the full dose-response curve of each ligand."""
+    return {
+        ligand: (ec50(A1, response), response)
+        for ligand, response in dose_response(A1, totals, network).items()
+    }
@@ -0,0 +1,247 @@
+"""
+Run a whole study from one driver process.
+
+A sweep is every combination of a maximum ligand concentration and a cell of
+the gradient, each simulated for a number of chunks. Cells run as tasks on a
+process pool; every worker imports the solvers and builds the model once and
+then keeps reusing them. Chunks go to the trajectory store and each cell keeps
+a checkpoint next to its trajectory, so an interrupted sweep picks up at the
+first missing chunk. ``--set`` applies named rate overrides (see
+``network.RateTable.override``) to every cell. With ``--summary-bins`` cells
+keep running moments per time bin instead of writing trajectories. Chunks of
+a seeded sweep go through the result cache, so re-running it (e.g. into a
+fresh store to regenerate a figure) reads the stored chunks instead of
+simulating them again.
+
+    python sweep.py --A1 0.02 0.05 --cells 36 --decay 8 --chunks 24
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from checkpoint import Checkpoint, load
+from model import ParameterValues
+from network import RECEPTOR_LEVELS, Observables, RateTable, build_network, load_rates
+from result_cache import cached_run_chunk
+from simulation import SEED_LIMIT, SOLVERS
+from solver_cache import compiled_solver
+from stats import Moments
+from stats import load as load_moments
+from trajectory_store import append
+
+RECORD = ("species", "tetramers")
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    A1: tuple[float, ...]
+    gradient: tuple[float, ...] = (1.0,)
+    chunks: int = 1
+    receptors: tuple[int, ...] = RECEPTOR_LEVELS
+    solver: str = "ssa"
+    chunk_time: float = 100.0
+    points: int = 100
+    name: str = "sweep"
+    store: str = "trajectories"
+    seed: int | None = None
+    record: str = "species"
+    summary_bins: int = 0
+    cache: bool = True
+    overrides: tuple[tuple[str, float], ...] = ()
+
+    @property
+    def timespan(self) -> np.ndarray:
+        """Sample times of one chunk, as in ``main.py``."""
+        return np.linspace(self.chunk_time / self.points, self.chunk_time, self.points)
+
+    def observables(self) -> Observables | None:
+        """What each chunk records: all species or only the tetramer totals."""
+        if self.record == "tetramers":
+            return build_network().tetramer_observables()
+        if self.record != "species":
+            raise ValueError(f"unknown record {self.record!r}, expected {RECORD}")
+        return None
+
+    def rates(self) -> RateTable | None:
+        """The rate table with ``overrides`` applied, ``None`` for the defaults."""
+        return load_rates().override(**dict(self.overrides)) if self.overrides else None
+
+    def run_name(self, A1: float) -> str:
+        return f"{self.name}-A1={A1:g}"
+
+    @property
+    def summary_path(self) -> Path:
+        # the underscore keeps the file out of the Parquet dataset
+        return Path(self.store) / f"_{self.name}-summary.npz"
+
+    def time_edges(self) -> np.ndarray:
+        """Time bins of the summary over the whole sweep."""
+        return np.linspace(0.0, self.chunks * self.chunk_time, self.summary_bins + 1)
+
+    def tasks(self) -> list[tuple[float, int, float]]:
+        """``(maximum A1, cell, cell A1)`` for every cell of the sweep."""
+        return [
+            (A1, cell, A1 * level)
+            for A1 in self.A1
+            for cell, level in enumerate(self.gradient)
+        ]
+
+
+def exponential_gradient(cells: int, decay: float) -> tuple[float, ...]:
+    """Relative ligand level ``exp(-cell / decay)`` of each cell."""
+    return tuple(np.exp(-np.arange(cells) / decay))
+
+
+def _start_worker(spec: SweepSpec) -> None:
+    """Build the network (and compile or load the SSA solver) once per worker."""
+    state = build_network().free_state(spec.receptors)
+    if spec.solver == "ssa":
+        compiled_solver(ParameterValues(spec.timespan, 0.0, state, spec.solver))
+
+
+def run_cell(
+    spec: SweepSpec, A1: float, cell: int, cell_A1: float, seed
+) -> tuple[int, Moments | None]:
+    """Simulate the missing chunks of one cell.
+
+    Returns how many chunks were run and, for a summary sweep, the cell's
+    moments.
+    """
+    run_name = spec.run_name(A1)
+    path = Path(spec.store) / f"run={run_name}" / f"cell={cell}" / "_checkpoint.npz"
+    if path.exists():
+        checkpoint = load(path)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = build_network().free_state(spec.receptors)
+        checkpoint = Checkpoint(state, 0.0, np.random.default_rng(seed))
+
+    observables = spec.observables()
+    names = observables.names if observables else build_network().species
+    moments = None
+    moments_path = path.with_name("_moments.npz")
+    if spec.summary_bins:
+        if moments_path.exists():
+            moments = load_moments(moments_path)
+            if not np.array_equal(moments.time_edges, spec.time_edges()):
+                raise ValueError(f"{moments_path} was binned for a different sweep")
+        else:
+            moments = Moments.empty(names, 1, spec.time_edges())
+
+    rates = spec.rates()
+    first = round(checkpoint.time / spec.chunk_time)
+    for chunk in range(first, spec.chunks):
+        parameter_values = ParameterValues(
+            spec.timespan, cell_A1, checkpoint.state, spec.solver, observables, rates
+        )
+        # only seeded sweeps can hit the cache, so others don't fill it
+        seed = checkpoint.rng
+        if spec.cache and spec.seed is not None:
+            seed = int(checkpoint.rng.integers(1, SEED_LIMIT))
+        time, recorded, checkpoint.state = cached_run_chunk(parameter_values, seed)
+        if moments is None:
+            time = checkpoint.time + time
+            append(spec.store, run_name, cell, chunk, time, recorded, names)
+        else:
+            # every solver samples at ``spec.timespan``, after the chunk start
+            moments.update(0, checkpoint.time + time, recorded)
+            moments.save(moments_path)
+        checkpoint.time += spec.chunk_time
+        checkpoint.save(path)
+    return spec.chunks - first, moments
+
+
+def run_sweep(spec: SweepSpec, workers: int | None = None) -> int:
+    """Run every cell of ``spec`` on a process pool; returns the chunks run.
+
+    With ``summary_bins`` the cells keep only running moments, which are
+    merged into one accumulator (a group per task) at ``spec.summary_path``.
+    """
+    if spec.solver not in SOLVERS:
+        raise ValueError(f"unknown solver {spec.solver!r}, expected one of {SOLVERS}")
+    spec.observables()
+    spec.rates()
+    tasks = spec.tasks()
+    seeds = np.random.SeedSequence(spec.seed).spawn(len(tasks))
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_start_worker,
+        initargs=(spec,),
+    ) as pool:
+        futures = [
+            pool.submit(run_cell, spec, *task, seed) for task, seed in zip(tasks, seeds)
+        ]
+        index = {future: group for group, future in enumerate(futures)}
+        chunks, summary = 0, None
+        for future in as_completed(futures):
+            ran, moments = future.result()
+            chunks += ran
+            if moments is not None:
+                if summary is None:
+                    summary = Moments.empty(
+                        moments.names, len(tasks), moments.time_edges
+                    )
+                summary.merge(moments, index[future])
+    if summary is not None:
+        summary.save(spec.summary_path)
+    return chunks
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--A1", type=float, nargs="+", required=True)
+    parser.add_argument("--cells", type=int, default=1)
+    parser.add_argument("--decay", type=float, default=np.inf)
+    parser.add_argument("--chunks", type=int, default=1)
+    parser.add_argument("--receptors", type=int, nargs=3, default=RECEPTOR_LEVELS)
+    parser.add_argument("--solver", choices=SOLVERS, default="ssa")
+    parser.add_argument("--chunk-time", type=float, default=100.0)
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--name", default="sweep")
+    parser.add_argument("--store", default="trajectories")
+    parser.add_argument("--record", choices=RECORD, default="species")
+    parser.add_argument("--summary-bins", type=int, default=0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="rate override, e.g. boost_up=100 or BMP7_off_scale=2",
+    )
+    parser.add_argument(
+        "--no-cache", dest="cache", action="store_false", help="bypass the result cache"
+    )
+    args = parser.parse_args(argv)
+
+    spec = SweepSpec(
+        A1=tuple(args.A1),
+        gradient=exponential_gradient(args.cells, args.decay),
+        chunks=args.chunks,
+        receptors=tuple(args.receptors),
+        solver=args.solver,
+        chunk_time=args.chunk_time,
+        points=args.points,
+        name=args.name,
+        store=args.store,
+        seed=args.seed,
+        record=args.record,
+        summary_bins=args.summary_bins,
+        cache=args.cache,
+        overrides=tuple(
+            (name, float(value))
+            for name, value in (item.split("=", 1) for item in args.overrides)
+        ),
+    )
+    print(f"ran {run_sweep(spec, args.workers)} chunks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Adaptive tau-leaping for the batched engine.
+
+Follows Cao, Gillespie & Petzold (2006) with the exact/leaped split made per
+species: a species is low-count when the ``epsilon`` bound would not allow
+even one molecule of change, and every reaction that changes a low-count
+species, or that could exhaust one of its reactants within ``N_CRITICAL``
+firings, is simulated exactly. The other reactions are leaped with Poisson
+firing counts over a step chosen so that none of their reactants is expected
+to change by more than ``epsilon``; each step ends at the next exact event or
+the leap, whichever comes first, so exact reactions fire at most once per
+step. Cells whose step would cover fewer than ``SSA_FACTOR`` expected events
+run ``SSA_STEPS`` exact SSA events instead, and leaps that would drive a
+count negative are retried with half the step.
+
+This is not a speed-up for the BMP network as it stands. Most events are the
+``Boost_up`` assembly steps, whose intermediates hold a few dozen copies at
+most, so those channels are always exact, the exact events come faster than
+any leap, and the engine runs the direct method with a little overhead
+(also at 20 times the reference receptor levels). It pays off only where
+the busy channels run through large copy numbers, e.g. about 2.5 times
+faster than ``batch`` with ``boost_up=1`` at 20 times the receptor levels;
+``hybrid`` is the engine that removes the fast assembly steps here.
+"""
+
+import numpy as np
+
+from batch_ssa import (
+    choose_reaction,
+    output_array,
+    propensities,
+    record_samples,
+    with_ones,
+)
+from network import Network, Observables, build_network
+
+EPSILON = 0.03
+N_CRITICAL = 10
+SSA_FACTOR = 10
+SSA_STEPS = 100
+
+
+def limiting_firings(network: Network, state: np.ndarray) -> np.ndarray:
+    """How often each reaction can fire before a reactant runs out."""
+    first, second = network.reactants.T
+    limit = state[:, first].copy()
+    pair = second >= 0
+    limit[:, pair] = np.minimum(limit[:, pair], state[:, second[pair]])
+    same = first == second
+    limit[:, same] //= 2
+    return limit
+
+
+def simulate(
+    A1,
+    init: np.ndarray,
+    timespan: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    network: Network | None = None,
+    epsilon: float = EPSILON,
+    observables: Observables | None = None,
+    final: np.ndarray | None = None,
+) -> np.ndarray:
+    """Tau-leaped trajectories of many cells, sampled at ``timespan``.
+
+    Takes and returns the same arrays as ``batch_ssa.simulate``.
+    """
+    network = network or build_network()
+    A1 = np.atleast_1d(np.asarray(A1, dtype=float))
+    n_cells, n_species = len(A1), network.n_species
+    rates = network.rates(A1)
+    state = with_ones(np.broadcast_to(init, (n_cells, n_species)).astype(np.int64))
+    stoichiometry = np.pad(network.stoichiometry, ((0, 0), (0, 1)))
+    change = network.stoichiometry.astype(float)
+    change_ones = np.pad(change, ((0, 0), (0, 1)))
+    changes = (change != 0).astype(float)
+    rng = np.random.default_rng(seed)
+
+    # reactant incidence and the highest order of reaction each species enters
+    is_reactant = np.zeros((network.n_reactions, n_species), dtype=bool)
+    for column in network.reactants.T:
+        used = column >= 0
+        is_reactant[np.flatnonzero(used), column[used]] = True
+    reactant_of = is_reactant.astype(float)
+    order = (network.reactants >= 0).sum(axis=1)
+    highest_order = (is_reactant * order[:, None]).max(axis=0)
+    with np.errstate(divide="ignore"):
+        inverse_order = np.where(highest_order > 0, 1.0 / highest_order, 0.0)
+
+    out = output_array(n_cells, timespan, network, observables)
+    time = np.zeros(n_cells)
+    sample = np.zeros(n_cells, dtype=np.int64)
+    ssa_left = np.zeros(n_cells, dtype=np.int64)
+    shrink = np.ones(n_cells)
+    cells = np.arange(n_cells)
+    while len(cells):
+        x = state[cells]
+        a = propensities(network, rates[cells], x)
+        total = a.sum(axis=1)
+
+        # cells still working off their exact SSA steps skip the step selection
+        exact_cell = ssa_left[cells] > 0
+        free = np.flatnonzero(~exact_cell)
+        exact = np.zeros(a.shape, dtype=bool)
+        tau = np.zeros(len(cells))
+        if len(free):
+            xf, af = x[free], a[free]
+            # exact channels are critical or change a low-count species
+            low = epsilon * xf[:, :-1] < highest_order
+            exact[free] = (af > 0) & (limiting_firings(network, xf) < N_CRITICAL)
+            exact[free] |= low.astype(float) @ changes.T > 0
+            leaped = np.where(exact[free], 0.0, af)
+            mean = leaped @ change
+            variance = leaped @ change**2
+            bound = np.maximum(epsilon * xf[:, :-1] * inverse_order, 1.0)
+            in_leap = (leaped > 0).astype(float) @ reactant_of > 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tf = np.minimum(bound / np.abs(mean), bound**2 / variance)
+                tf = np.where(in_leap, tf, np.inf).min(axis=1) * shrink[cells[free]]
+                # a step ends at the leap or the next exact event
+                exact_rate = np.where(exact[free], af, 0.0).sum(axis=1)
+                reach = np.minimum(tf, 1.0 / exact_rate) * total[free]
+            tau[free] = tf
+            start_ssa = reach < SSA_FACTOR
+            ssa_left[cells[free[start_ssa]]] = SSA_STEPS
+            exact_cell[free[start_ssa]] = True
+
+        # exact SSA events for cells where a step would not cover enough events
+        if exact_cell.any():
+            ssa, ae, te = cells[exact_cell], a[exact_cell], total[exact_cell]
+            with np.errstate(divide="ignore"):
+                next_time = time[ssa] + rng.exponential(1.0, len(ssa)) / te
+            record_samples(
+                out, state, sample, timespan, ssa, next_time, observables, final
+            )
+            fired = np.isfinite(next_time)
+            reaction = choose_reaction(ae, te, rng)
+            state[ssa[fired]] += stoichiometry[reaction[fired]]
+            time[ssa] = next_time
+            ssa_left[ssa] -= 1
+
+        leap = ~exact_cell
+        if leap.any():
+            cl, al, tau = cells[leap], a[leap], tau[leap]
+            exact_a = np.where(exact[leap], al, 0.0)
+            exact_total = exact_a.sum(axis=1)
+            with np.errstate(divide="ignore"):
+                tau_exact = rng.exponential(1.0, len(cl)) / exact_total
+            # never leap past the next sample time
+            upcoming = np.searchsorted(timespan, time[cl], side="right")
+            until_sample = np.full(len(cl), np.inf)
+            ahead = upcoming < len(timespan)
+            until_sample[ahead] = timespan[upcoming[ahead]] - time[cl[ahead]]
+            step = np.minimum(np.minimum(tau, tau_exact), until_sample)
+
+            mean_firings = np.where(exact[leap], 0.0, al) * step[:, None]
+            firings = rng.poisson(mean_firings).astype(float)
+            fire_exact = (tau_exact <= tau) & (tau_exact <= until_sample)
+            if fire_exact.any():
+                rows = np.flatnonzero(fire_exact)
+                chosen = choose_reaction(exact_a[rows], exact_total[rows], rng)
+                firings[rows, chosen] += 1
+            proposal = state[cl] + np.rint(firings @ change_ones).astype(np.int64)
+
+            accepted = (proposal >= 0).all(axis=1)
+            shrink[cl[~accepted]] *= 0.5
+            ok = cl[accepted]
+            next_time = time[ok] + step[accepted]
+            record_samples(
+                out, state, sample, timespan, ok, next_time, observables, final
+            )
+            state[ok] = proposal[accepted]
+            time[ok] = next_time
+            shrink[ok] = 1.0
+
+        cells = cells[sample[cells] < len(timespan)]
+    return out
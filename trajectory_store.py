@@ -0,0 +1,126 @@
+"""
+Append-only columnar store for simulated trajectories.
+
+Every chunk of a cell becomes one zstd-compressed Parquet file under
+``root/run=<run>/cell=<cell>/``, with a float64 ``time`` column and one
+column per species (or per recorded observable) named after it. Stochastic
+counts are stored as int32. Reads go through a hive-partitioned dataset, so
+selecting a few columns or one run/cell only decodes those columns and files.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from network import build_network
+
+
+def append(
+    root: str | Path,
+    run: str,
+    cell: int,
+    chunk: int,
+    time: np.ndarray,
+    counts: np.ndarray,
+    names: tuple[str, ...] | None = None,
+) -> Path:
+    """Write one chunk of ``counts`` (``(timepoints, columns)``).
+
+    Columns are named ``names``, by default the species in network order.
+    Integral counts are stored as int32; anything else, e.g. ODE output, is
+    kept as float64.
+    """
+    names = names or build_network().species
+    if np.array_equal(counts, np.round(counts)):
+        counts = counts.astype(np.int32)
+    columns = {"time": np.asarray(time, dtype=float)}
+    columns.update(zip(names, np.asarray(counts).T))
+    path = Path(root) / f"run={run}" / f"cell={cell}" / f"chunk-{chunk:06d}.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table(columns), path, compression="zstd")
+    return path
+
+
+def read(
+    root: str | Path,
+    columns: list[str] | None = None,
+    run: str | None = None,
+    cell: int | None = None,
+) -> pd.DataFrame:
+    """Trajectories as one frame with ``run``, ``cell`` and ``time`` keys.
+
+    ``columns`` limits the species or observables that are decoded; ``run``
+    and ``cell`` select partitions without opening the other files.
+    """
+    dataset = ds.dataset(root, format="parquet", partitioning="hive")
+    condition = None
+    for key, value in (("run", run), ("cell", cell)):
+        if value is not None:
+            term = ds.field(key) == value
+            condition = term if condition is None else condition & term
+
+    # chunks may differ in columns (species or observables) and in type
+    # (integer SSA or float ODE counts); unify over the selected files only
+    fragments = list(dataset.get_fragments(filter=condition))
+    schemas = list(dict.fromkeys(fragment.physical_schema for fragment in fragments))
+    keys = ["run", "cell", "time"]
+    schema = pa.unify_schemas(
+        [*schemas, dataset.partitioning.schema], promote_options="permissive"
+    )
+    selected = ds.FileSystemDataset(
+        fragments, schema, dataset.format, filesystem=dataset.filesystem
+    )
+    if columns is None:
+        columns = [name for name in schema.names if name not in keys]
+    frame = selected.to_table(columns=keys + list(columns)).to_pandas()
+    return frame.sort_values(["run", "cell", "time"], kind="stable", ignore_index=True)
+
+
+def tetramers(root: str | Path, ligand: str, **keys) -> pd.DataFrame:
+    """Only the tetramer columns of ``ligand``, e.g. for positional information."""
+    network = build_network()
+    columns = [network.species[i] for i in network.tetramers(ligand)]
+    return read(root, columns, **keys)
+
+
+def cells(root: str | Path, run: str) -> list[int]:
+    """Cell numbers stored for ``run``."""
+    paths = (Path(root) / f"run={run}").glob("cell=*")
+    return sorted(int(path.name.split("=", 1)[1]) for path in paths)
+
+
+def iter_chunks(
+    root: str | Path,
+    run: str,
+    columns: list[str],
+    cell_numbers: list[int] | None = None,
+):
+    """Stream ``run`` one chunk at a time as ``(time, values)``.
+
+    ``values`` has shape ``(cells, timepoints, columns)``, so only one chunk
+    of every cell is in memory. Every solver samples after its chunk start,
+    so sample times rise strictly through the whole run; a repeated or
+    out-of-order sample raises ``ValueError``, since it would enter every
+    spectrum or departure that spans the chunk boundary.
+    """
+    base = Path(root) / f"run={run}"
+    cell_numbers = cell_numbers or cells(root, run)
+    names = sorted(path.name for path in base.glob(f"cell={cell_numbers[0]}/*.parquet"))
+    last = -np.inf
+    for name in names:
+        tables = [
+            pq.read_table(base / f"cell={cell}" / name, columns=["time", *columns])
+            for cell in cell_numbers
+        ]
+        time = tables[0]["time"].to_numpy()
+        if len(time) and (time[0] <= last or (np.diff(time) <= 0).any()):
+            raise ValueError(f"{name} of run {run!r} repeats or goes back in time")
+        values = np.stack(
+            [np.column_stack([t[c].to_numpy() for c in columns]) for t in tables]
+        )
+        last = time[-1] if len(time) else last
+        yield time, values